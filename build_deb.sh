@@ -36,6 +36,10 @@ cd "$TEMP_BUILD_DIR"
 echo "Updating yt-dlp to latest version..."
 "$VENV_PYTHON" -m pip install --upgrade yt-dlp
 
+# Compile Qt resources (embedded icon) next to main.py
+echo "Compiling Qt resources..."
+"$(dirname "$VENV_PYTHON")/pyside6-rcc" resources.qrc -o resources_rc.py
+
 # 2. Build executable with PyInstaller
 echo "Building executable..."
 # Build with explicit arguments to ensure version.txt and assets are included
@@ -13,6 +13,9 @@ python -m pip install Pillow
 echo Updating yt-dlp to latest version...
 python -m pip install --upgrade yt-dlp
 
+echo Compiling Qt resources...
+pyside6-rcc resources.qrc -o resources_rc.py
+
 echo Building Hyper Download Manager (Windowed)...
 python -m PyInstaller --noconfirm --onedir --windowed --name "HyperDownloadManager" --icon "icon.ico" --add-data "ui;ui" --add-data "core;core" --add-data "utils;utils" --add-data "extension;extension" --add-data "LICENSE.txt;." --add-data "icon.png;." --add-data "icon.ico;." --add-data "version.txt;." main.py
 
@@ -1,4 +1,5 @@
 import os
+import re
 import requests
 import time
 from PySide6.QtCore import QObject, QThread, Signal, QMutex, QMutexLocker
@@ -15,6 +16,37 @@ except ImportError:
     proxy_manager = None
 
 
+# yt-dlp output fragments (lowercased) that point at a network/proxy failure,
+# compiled into one alternation so each output line is scanned once
+_NETWORK_ERROR_INDICATORS = (
+    "timed out",
+    "timeout",
+    "connection refused",
+    "connection reset",
+    "unable to download webpage",
+    "proxy error",
+    "httpconnectionpool",
+    "httpsconnectionpool",
+    "max retries exceeded",
+    "network is unreachable",
+    "no route to host",
+    "http error 403",
+    "http error 429",
+    "got error: 403",
+    "got error",  # Generic yt-dlp error during download
+    "urlopen error",
+    "errno 10060",
+    "errno 10061",
+    "errno 111",
+    "failed to resolve",
+    "name resolution",
+    "connect timeout",
+    "read timeout",
+    "giving up after",
+)
+_NETWORK_ERROR_RE = re.compile("|".join(re.escape(s) for s in _NETWORK_ERROR_INDICATORS))
+
+
 # REMOVED get_proxy_url() and get_proxy_dict()
 # Proxies are now ONLY used for YouTube downloads via yt-dlp
 # Regular downloads use direct connection for better performance and reliability
@@ -240,51 +272,24 @@ class YtDlpWorker(QThread):
                 line_lower = line.lower()
                 
                 # Detect network/proxy errors - IMPROVED DETECTION
-                error_indicators = [
-                    "timed out",
-                    "timeout",
-                    "connection refused",
-                    "connection reset",
-                    "unable to download webpage",
-                    "proxy error",
-                    "httpconnectionpool",
-                    "httpsconnectionpool",
-                    "max retries exceeded",
-                    "network is unreachable",
-                    "no route to host",
-                    "http error 403",
-                    "http error 429",
-                    "got error: 403",
-                    "got error",  # Generic yt-dlp error during download
-                    "urlopen error",
-                    "errno 10060",
-                    "errno 10061",
-                    "errno 111",
-                    "failed to resolve",
-                    "name resolution",
-                    "connect timeout",
-                    "read timeout",
-                    "giving up after",
-                ]
-                
-                for indicator in error_indicators:
-                    if indicator in line_lower:
-                        network_error = True
-                        print(f"DEBUG: Network error detected: {indicator}")
-                        # Emit warning immediately on first network error
-                        if not hasattr(self, '_warning_emitted'):
-                            self._warning_emitted = True
-                            self.proxy_fallback_warning.emit()
-                            print("DEBUG: ⚠️ Proxy fallback warning emitted")
-                        
-                        # Stop yt-dlp immediately to try proxy instead
-                        if proxy_url is None and not hasattr(self, '_first_error_stop'):
-                            self._first_error_stop = True
-                            print("DEBUG: Stopping direct attempt, will retry with proxy...")
-                            process.terminate()
-                            process.wait()
-                            return "failed"
-                        break
+                m = _NETWORK_ERROR_RE.search(line_lower)
+                if m:
+                    indicator = m.group(0)
+                    network_error = True
+                    print(f"DEBUG: Network error detected: {indicator}")
+                    # Emit warning immediately on first network error
+                    if not hasattr(self, '_warning_emitted'):
+                        self._warning_emitted = True
+                        self.proxy_fallback_warning.emit()
+                        print("DEBUG: ⚠️ Proxy fallback warning emitted")
+                    
+                    # Stop yt-dlp immediately to try proxy instead
+                    if proxy_url is None and not hasattr(self, '_first_error_stop'):
+                        self._first_error_stop = True
+                        print("DEBUG: Stopping direct attempt, will retry with proxy...")
+                        process.terminate()
+                        process.wait()
+                        return "failed"
                 
                 # Detect "giving up"
                 if "giving up" in line_lower:
@@ -541,6 +546,17 @@ class DownloadTask(QObject):
     error_occurred = Signal(str)
     proxy_fallback_warning = Signal()
 
+    @property
+    def save_path(self):
+        return self._save_path
+
+    @save_path.setter
+    def save_path(self, path):
+        # Split once here so the UI can read save_dir/save_name freely;
+        # this also keeps them right when yt-dlp changes the extension
+        self._save_path = path
+        self.save_dir, self.save_name = os.path.split(path)
+
     def __init__(self, url, save_path, file_size=0, threads=4, quality=None, itag=None):
         super().__init__()
         self.url = url
@@ -558,8 +574,7 @@ class DownloadTask(QObject):
         
         self._active_worker = None
         
-        self.save_dir = os.path.dirname(save_path)
-        self.file_name = os.path.basename(save_path)
+        self.file_name = self.save_name
         
         # Sanitize filename for use in paths (remove trailing/invalid chars)
         import re
@@ -1,4 +1,5 @@
 import os
+import re
 import requests
 import time
 from PySide6.QtCore import QObject, QThread, Signal, QMutex, QMutexLocker
@@ -15,6 +16,29 @@ except ImportError:
     proxy_manager = None
 
 
+# yt-dlp output fragments that point at a network/proxy failure, compiled
+# into one case-insensitive alternation so each output line is scanned once
+_NETWORK_ERROR_INDICATORS = (
+    "Unable to download webpage",
+    "Connection refused",
+    "Connection reset",
+    "Connection timed out",
+    "Proxy error",
+    "HTTPSConnectionPool",
+    "Max retries exceeded",
+    "Network is unreachable",
+    "No route to host",
+    "HTTP Error 403",
+    "HTTP Error 429",
+    "Got error: 403",
+    "urlopen error",
+    "Errno 10060",
+    "Errno 10061",
+    "Errno 111",
+)
+_NETWORK_ERROR_RE = re.compile("|".join(re.escape(s) for s in _NETWORK_ERROR_INDICATORS), re.IGNORECASE)
+
+
 def get_proxy_url():
     """Get proxy URL - user configured or built-in"""
     # First check user-configured proxy
@@ -202,29 +226,8 @@ class YtDlpWorker(QThread):
                     print(f"yt-dlp: {line}")
                 
                 # Detect network/proxy errors
-                error_indicators = [
-                    "Unable to download webpage",
-                    "Connection refused",
-                    "Connection reset",
-                    "Connection timed out",
-                    "Proxy error",
-                    "HTTPSConnectionPool",
-                    "Max retries exceeded",
-                    "Network is unreachable",
-                    "No route to host",
-                    "HTTP Error 403",
-                    "HTTP Error 429",
-                    "Got error: 403",
-                    "urlopen error",
-                    "Errno 10060",
-                    "Errno 10061",
-                    "Errno 111",
-                ]
-                
-                for indicator in error_indicators:
-                    if indicator.lower() in line.lower():
-                        network_error = True
-                        break
+                if _NETWORK_ERROR_RE.search(line):
+                    network_error = True
                 
                 if "[download]" in line:
                     if "Destination:" in line:
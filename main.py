@@ -1,9 +1,16 @@
 import sys
 import os
+import logging
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon, QFont, QFontDatabase
 from PySide6.QtCore import Qt, QCoreApplication
 
+# Compiled Qt resources (icon.png) are generated at build time from resources.qrc
+try:
+    import resources_rc  # noqa: F401
+except ImportError:
+    pass
+
 
 def setup_environment():
     """Configure environment for optimal rendering"""
@@ -16,6 +23,13 @@ def setup_environment():
         os.environ["QT_FONT_DPI"] = "96"
 
 
+def setup_logging():
+    """Configure the hdm.* loggers; debug output is opt-in with HDM_DEBUG=1"""
+    logging.basicConfig(format="%(levelname)s: %(name)s: %(message)s")
+    level = logging.DEBUG if os.environ.get("HDM_DEBUG") else logging.WARNING
+    logging.getLogger("hdm").setLevel(level)
+
+
 def load_fonts(app: QApplication):
     """Load custom fonts if available"""
     font_paths = [
@@ -58,6 +72,7 @@ def setup_application() -> QApplication:
     """Initialize and configure the application"""
     from utils.helpers import get_app_version
     setup_environment()
+    setup_logging()
     
     # Create application
     app = QApplication(sys.argv)
@@ -166,6 +166,35 @@ class IconLabel(QLabel):
         self.apply_theme()
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+#                              ELIDED LABEL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ElidedLabel(QLabel):
+    """Single-line label that elides its text to the width it's given"""
+    
+    def __init__(self, text: str = "", mode=Qt.ElideMiddle, parent=None):
+        super().__init__(parent)
+        self._full_text = text
+        self._mode = mode
+        self.setToolTip(text)
+        
+    def full_text(self) -> str:
+        return self._full_text
+        
+    def minimumSizeHint(self) -> QSize:
+        # Let layouts shrink the label; the text is elided to fit
+        return QSize(0, super().minimumSizeHint().height())
+        
+    def sizeHint(self) -> QSize:
+        return QSize(self.fontMetrics().horizontalAdvance(self._full_text),
+                     super().sizeHint().height())
+        
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.setText(self.fontMetrics().elidedText(self._full_text, self._mode, self.width()))
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #                              CARD WIDGET
 # ═══════════════════════════════════════════════════════════════════════════════
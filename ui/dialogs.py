@@ -1,57 +1,397 @@
 import requests
+import logging
 import os
+import re
+import subprocess
+import sys
+import threading
 import time
+from concurrent.futures import (ThreadPoolExecutor, Future, wait, FIRST_COMPLETED,
+                                TimeoutError as FutureTimeoutError)
+from functools import lru_cache, partial
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse, unquote, parse_qs
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                                QLineEdit, QPushButton, QProgressBar, QFileDialog, 
                                QGridLayout, QWidget, QSpacerItem, QSizePolicy,
-                               QGraphicsDropShadowEffect, QFrame, QApplication)
-from PySide6.QtCore import Qt, QThread, Signal, QStandardPaths, QSize, QPropertyAnimation, QUrl
-from PySide6.QtGui import QColor, QFont, QPixmap, QDesktopServices
+                               QGraphicsDropShadowEffect, QFrame, QApplication,
+                               QMessageBox)
+from PySide6.QtCore import (Qt, Signal, Slot, QSettings, QStandardPaths, QSize, QPropertyAnimation,
+                            QUrl, QFile, QObject, QRunnable, QThreadPool, QTimer)
+from PySide6.QtGui import QFont, QPixmap, QDesktopServices
 
 from ui.theme_manager import theme
 from ui.icons import IconType, IconProvider, get_pixmap
 from ui.components import (IconButton, IconLabel, Card, AnimatedProgressBar, 
-                           StatusBadge, SectionHeader, Divider)
-from utils.helpers import format_bytes, format_speed, format_time
+                           StatusBadge, SectionHeader, Divider, ElidedLabel)
+from utils.helpers import format_bytes, format_speed, format_time, get_resource_path
+from utils.metadata_cache import metadata_cache
+
+try:
+    from core.proxy_manager import proxy_manager
+except ImportError:
+    proxy_manager = None
+
+log = logging.getLogger("hdm.metadata")
+
+
+def _set_text(label, text: str):
+    """Set label text only when it changed, sparing a relayout and repaint"""
+    if label.text() != text:
+        label.setText(text)
+
+
+def _set_state(widget, state: str):
+    """Switch a widget's "state" property and repolish it against the dialog rules"""
+    if widget.property("state") == state:
+        return
+    widget.setProperty("state", state)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+# Filename cleanup: drop everything except word characters and " ._-()[]",
+# then collapse whitespace runs
+_UNSAFE_NAME_RE = re.compile(r"[^\w .()\[\]-]")
+_WS_RE = re.compile(r"\s+")
+
+
+def _sanitize_filename(n):
+    """Clean filename of invalid characters"""
+    if not n:
+        return ""
+    result = _WS_RE.sub(" ", _UNSAFE_NAME_RE.sub("", n)).strip()
+    return result[:200]  # Limit length
+
+
+# Keep yt-dlp from flashing a console window on Windows
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+
+
+# Content-Disposition filename, e.g. attachment; filename="setup.exe"
+_CD_FILENAME_RE = re.compile(r'filename[*]?=["\']?([^"\';]+)')
+
+# yt-dlp stderr fragments (lowercased) that mean the connection is blocked
+# and another route is worth trying
+_BLOCKING_INDICATORS = (
+    "try refreshing",
+    "sign in to confirm",
+    "blocked",
+    "http error 403",
+    "403 forbidden",
+    "connection refused",
+    "connection reset",
+    "timed out",
+    "urlopen error",
+    "proxy error",
+    "unable to download webpage",
+)
+_BLOCKING_RE = re.compile("|".join(re.escape(s) for s in _BLOCKING_INDICATORS))
+
+
+# Browser-like headers for metadata probes, shared by one keep-alive session
+# so repeat lookups reuse pooled connections instead of a new TLS handshake
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'identity',  # Don't use gzip for range requests
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+_RANGE_HEADERS = {'Range': 'bytes=0-0'}
+
+_HTTP = requests.Session()
+_HTTP.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=0))
+_HTTP.mount('http://', HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=0))
+_HTTP.headers.update(_DEFAULT_HEADERS)
+
+
+# Browser extension links offered by the welcome dialog
+CHROME_URL = "chrome://extensions"
+EDGE_URL = "edge://extensions"
+FIREFOX_URL = "https://addons.mozilla.org/en-US/firefox/addon/hyper-download-manager/"
+_FIREFOX_QURL = QUrl(FIREFOX_URL)
+
+# The platform download folder can't change while the app runs, and looking it
+# up goes through the shell known-folder API on Windows, so resolve it once.
+@lru_cache(maxsize=1)
+def _default_download_dir():
+    """Get the user's download folder, resolved on first use"""
+    return (QStandardPaths.writableLocation(QStandardPaths.DownloadLocation)
+            or os.path.expanduser("~/Downloads"))
+
+
+@lru_cache(maxsize=1)
+def _app_icon_pixmap() -> QPixmap:
+    """Get icon.png, decoded once; QPixmap is implicitly shared so reuse is safe"""
+    # Prefer the copy compiled into resources_rc, fall back to the file on disk
+    if QFile.exists(":/icon.png"):
+        return QPixmap(":/icon.png")
+    return QPixmap(get_resource_path("icon.png"))
+
+
+@lru_cache(maxsize=8)
+def _icon_at(size: int) -> QPixmap:
+    """Get the app icon pre-scaled to size x size logical pixels"""
+    pixmap = _app_icon_pixmap()
+    if pixmap.isNull():
+        return pixmap
+    # Scale once for the screen so a QLabel can blit it as-is on every paint,
+    # instead of rescaling it each time through setScaledContents
+    screen = QApplication.primaryScreen()
+    dpr = screen.devicePixelRatio() if screen else 1.0
+    side = int(size * dpr)
+    pixmap = pixmap.scaled(side, side, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+@lru_cache(maxsize=1)
+def _extension_path() -> str:
+    """Get the bundled browser extension folder"""
+    try:
+        return get_resource_path("extension")
+    except Exception:
+        return os.path.join(os.getcwd(), "extension")
+
+
+# QSettings key remembering the folder last picked in the confirmation dialog
+_LAST_DIR_KEY = "last_download_dir"
+
+# Folders already listed by _warm_dir_cache this session
+_WARMED_DIRS = set()
+
+
+def _warm_dir_cache(path):
+    """Stat the entries of path so the first Browse click finds the OS cache warm.
+
+    Runs on the global thread pool and only touches the filesystem.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    entry.stat()
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+def _prewarm_dir(path):
+    if path in _WARMED_DIRS:
+        return
+    _WARMED_DIRS.add(path)
+    QThreadPool.globalInstance().start(partial(_warm_dir_cache, path))
+
+
+# Launchers that open a file or folder with its default application;
+# Windows uses os.startfile, which also copes with mixed path separators
+if sys.platform == 'darwin':
+    _SHELL_OPEN = ('open',)
+else:
+    _SHELL_OPEN = ('xdg-open',)
+
+
+def _shell_open(path):
+    """Open path with its default application.
+
+    Runs on the global thread pool: the existence check can stall on
+    network drives and the shell can take seconds to start.
+    """
+    if not os.path.exists(path):
+        return
+    try:
+        if sys.platform == 'win32':
+            os.startfile(path)
+        else:
+            subprocess.Popen([*_SHELL_OPEN, path],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        log.warning("Could not open %s: %s", path, e)
+
+
+def _open_in_background(path):
+    QThreadPool.globalInstance().start(partial(_shell_open, path))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #                           METADATA FETCHER
 # ═══════════════════════════════════════════════════════════════════════════════
 
-class MetadataFetcher(QThread):
-    """Fetches video/file metadata with automatic proxy support for YouTube"""
+class ProxyBreaker:
+    """
+    Per-proxy circuit breaker: CLOSED until repeated failures trip it OPEN,
+    then HALF_OPEN lets a single trial through once the cooldown has passed.
+    """
+    __slots__ = ('fail', 'state', 'opened_at')
+
+    FAIL_LIMIT = 3
+    COOLDOWN = 60  # seconds
+
+    def __init__(self):
+        self.fail = 0
+        self.state = 'CLOSED'
+        self.opened_at = 0.0
+
+    def allows(self):
+        if self.state == 'CLOSED':
+            return True
+        if time.monotonic() - self.opened_at < self.COOLDOWN:
+            return False
+        # Let one trial through and hold any others for another window
+        self.state = 'HALF_OPEN'
+        self.opened_at = time.monotonic()
+        return True
+
+    def record_failure(self):
+        self.fail += 1
+        if self.state == 'HALF_OPEN' or self.fail >= self.FAIL_LIMIT:
+            self.state = 'OPEN'
+            self.opened_at = time.monotonic()
+
+    def record_success(self):
+        self.fail = 0
+        self.state = 'CLOSED'
+
+
+# Shared by every fetcher so a dead proxy is remembered across dialogs
+_breakers: dict[str, ProxyBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def _proxy_allowed(proxy_url):
+    with _breakers_lock:
+        breaker = _breakers.get(proxy_url)
+        return breaker is None or breaker.allows()
+
+
+def _record_proxy_result(proxy_url, ok):
+    with _breakers_lock:
+        breaker = _breakers.setdefault(proxy_url, ProxyBreaker())
+        if ok:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+
+# Metadata lookups are almost entirely waiting on the network or yt-dlp, so
+# dialogs share one pool instead of starting a QThread each. The cap is
+# generous so a burst of queued links never waits behind a slow lookup
+_METADATA_POOL = QThreadPool()
+_METADATA_POOL.setMaxThreadCount(16)
+
+# Queued fetchers are kept referenced here until run() returns, so a dialog
+# dropping its fetcher can't free it while the pool still holds it
+_ACTIVE_FETCHERS = set()
+
+
+class _FetcherSignals(QObject):
+    """Signals for MetadataFetcher, which as a QRunnable can't declare its own"""
     finished = Signal(str, int)
+    # Follows an early provisional finished() once the real title is known
+    title_updated = Signal(str, int)
     status = Signal(str)
 
+
+class MetadataFetcher(QRunnable):
+    """Fetches video/file metadata with automatic proxy support for YouTube"""
+
+    # Proxied yt-dlp attempts raced alongside the direct one
+    _PROXY_ATTEMPTS = 3
+    _PROXY_STATUS = ("Finding proxy...", "Trying another proxy...", "Last proxy attempt...")
+
+    # Every yt-dlp metadata call shares this prefix; only --proxy and the URL vary
+    _YTDLP_BASE = (
+        "yt-dlp",
+        "--print", "%(title)s|||%(filesize,filesize_approx)s",
+        "--no-playlist",
+        "--no-warnings",
+        "--socket-timeout", "20",
+    )
+
     def __init__(self, url):
         super().__init__()
+        self.setAutoDelete(False)
         self.url = url
+        self.signals = _FetcherSignals()
+        self._cancelled = False
+        self._procs = set()
+        self._procs_lock = threading.Lock()
+        self._race_over = False
+        self._direct_failed = False
+        self._raced_proxies = set()
+        self._provisional_sent = False
+
+    def start(self):
+        """Queue the fetch on the shared metadata pool"""
+        _ACTIVE_FETCHERS.add(self)
+        _METADATA_POOL.start(self)
+
+    def cancel(self):
+        """Stop delivering results and kill any yt-dlp still running"""
+        self._cancelled = True
+        self._kill_ytdlp()
+
+    def _emit_result(self, name, size):
+        """Emit the result unless the owning dialog has already gone away"""
+        if self._cancelled:
+            return
+        if self._provisional_sent:
+            self.signals.title_updated.emit(name, size)
+        else:
+            self.signals.finished.emit(name, size)
+
+    def _emit_provisional(self, name):
+        """Unblock the dialog with a placeholder name while the lookup continues"""
+        if not self._cancelled:
+            self.signals.finished.emit(name, 0)
+            self._provisional_sent = True
 
     def _get_working_proxy(self):
         """Get a working proxy URL from ProxyManager"""
+        if proxy_manager is None:
+            log.debug("proxy_manager not available")
+            return None
         try:
-            from core.proxy_manager import proxy_manager
-            
-            # Refresh proxies if needed
-            if proxy_manager.needs_refresh() or proxy_manager.get_working_count() == 0:
-                self.status.emit("Finding proxies...")
-                
-                import threading
-                event = threading.Event()
-                
-                def on_done(success):
-                    event.set()
+            # Only block when there is nothing usable yet; a stale but
+            # non-empty list is refreshed in the background while we use it
+            if proxy_manager.get_working_count() == 0:
+                if self._direct_failed:
+                    self.signals.status.emit("Finding proxies...")
                 
-                proxy_manager.refresh_proxies(callback=on_done)
-                event.wait(timeout=60)
+                refreshed = Future()
+                proxy_manager.refresh_proxies(
+                    callback=lambda ok: refreshed.set_result(ok) if not refreshed.done() else None
+                )
+                # Wait in short slices so a finished race or a cancel
+                # doesn't leave this thread parked on the refresh
+                deadline = time.monotonic() + 60
+                while not self._race_over:
+                    try:
+                        refreshed.result(timeout=0.5)
+                        break
+                    except FutureTimeoutError:
+                        if time.monotonic() >= deadline:
+                            log.debug("Proxy refresh still running after 60s")
+                            break
+                if self._race_over:
+                    return None
+            elif proxy_manager.needs_refresh() and not proxy_manager.is_fetching():
+                proxy_manager.refresh_proxies()
             
-            return proxy_manager.get_proxy()
-        except ImportError:
-            print("DEBUG: proxy_manager not available")
+            # Skip proxies whose breaker is open instead of waiting out
+            # another yt-dlp timeout on them
+            for _ in range(max(1, proxy_manager.get_proxy_count())):
+                proxy_url = proxy_manager.get_proxy()
+                if not proxy_url or _proxy_allowed(proxy_url):
+                    return proxy_url
+                log.debug("Skipping proxy with open breaker: %.40s", proxy_url)
             return None
         except Exception as e:
-            print(f"DEBUG: Proxy manager error: {e}")
+            log.debug("Proxy manager error: %s", e)
             return None
 
     def _try_ytdlp_metadata(self, proxy_url=None):
@@ -59,382 +399,419 @@ class MetadataFetcher(QThread):
         Try to get metadata using yt-dlp.
         Returns: (title, size) or raises exception
         """
-        import subprocess
-        
-        cmd = [
-            "yt-dlp",
-            "--print", "%(title)s|||%(filesize,filesize_approx)s",
-            "--no-playlist",
-            "--no-warnings",
-            "--socket-timeout", "20",
-        ]
-        
+        cmd = list(self._YTDLP_BASE)
         if proxy_url:
-            cmd.extend(["--proxy", proxy_url])
+            cmd += ("--proxy", proxy_url)
         
         cmd.append(self.url)
         
-        proxy_display = "direct" if not proxy_url else proxy_url.split('@')[-1][:30]
-        print(f"DEBUG: yt-dlp metadata ({proxy_display}): {' '.join(cmd[:5])}...")
+        proxy_display = "direct" if not proxy_url else proxy_url.rpartition('@')[2][:30]
+        log.debug("yt-dlp metadata (%s): %s...", proxy_display, cmd[1:5])
         
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=35,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+            creationflags=_CREATION_FLAGS
         )
+        with self._procs_lock:
+            self._procs.add(proc)
+            if self._race_over:
+                proc.kill()
+        # Drain stderr on the side so a chatty yt-dlp can't stall on a full pipe
+        err_chunks = []
+        drain = threading.Thread(target=lambda: err_chunks.append(proc.stderr.read()), daemon=True)
+        drain.start()
+        
+        timed_out = threading.Event()
+        
+        def expire():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(35, expire)
+        timer.start()
+        answer = ""
+        try:
+            # --print writes the answer as soon as extraction is done; yt-dlp
+            # may keep going after that, so stop it once the line arrives
+            for line in proc.stdout:
+                if '|||' in line:
+                    answer = line.strip()
+                    proc.kill()
+                    break
+            proc.wait()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+            with self._procs_lock:
+                self._procs.discard(proc)
+        drain.join(timeout=1)
+        
+        if answer:
+            parts = answer.split('|||')
+            title = parts[0].strip()
+            if not title:
+                return None, 0
+            size = 0
+            if len(parts) >= 2:
+                try:
+                    size_str = parts[1].strip()
+                    if size_str and size_str.lower() not in ['na', 'none', '']:
+                        size = int(float(size_str))
+                except ValueError:
+                    pass
+            return title, size
         
-        stdout = result.stdout.strip() if result.stdout else ""
-        stderr = result.stderr.lower() if result.stderr else ""
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, 35)
         
-        # Check for blocking errors
-        blocking_indicators = [
-            "try refreshing",
-            "sign in to confirm",
-            "blocked",
-            "http error 403",
-            "403 forbidden",
-            "connection refused",
-            "connection reset",
-            "timed out",
-            "urlopen error",
-            "proxy error",
-            "unable to download webpage",
-        ]
+        stderr = "".join(err_chunks).lower()
         
-        for indicator in blocking_indicators:
-            if indicator in stderr:
-                print(f"DEBUG: Detected blocking: {indicator}")
-                raise ConnectionError(f"YouTube blocked: {indicator}")
-        
-        if result.returncode == 0 and stdout:
-            parts = stdout.split('|||')
-            if len(parts) >= 1 and parts[0]:
-                title = parts[0].strip()
-                size = 0
-                if len(parts) >= 2:
-                    try:
-                        size_str = parts[1].strip()
-                        if size_str and size_str.lower() not in ['na', 'none', '']:
-                            size = int(float(size_str))
-                    except:
-                        pass
-                return title, size
+        # Check for blocking errors
+        m = _BLOCKING_RE.search(stderr)
+        if m:
+            log.debug("Detected blocking: %s", m.group(0))
+            raise ConnectionError(f"YouTube blocked: {m.group(0)}")
         
-        if result.returncode != 0:
-            raise RuntimeError(f"yt-dlp failed with code {result.returncode}")
+        if proc.returncode != 0:
+            raise RuntimeError(f"yt-dlp failed with code {proc.returncode}")
         
         return None, 0
 
+    def _race_attempt(self, use_proxy):
+        """
+        One racer: the direct yt-dlp call, or a proxy lookup followed by a
+        call through that proxy. Runs on the race pool.
+        Returns: (proxy_url, title, size) - title is None when the attempt failed
+        """
+        proxy_url = None
+        if use_proxy:
+            proxy_url = self._get_working_proxy()
+            with self._procs_lock:
+                if not proxy_url or proxy_url in self._raced_proxies or self._race_over:
+                    return proxy_url, None, 0
+                self._raced_proxies.add(proxy_url)
+            log.debug("Racing proxy: %.40s...", proxy_url)
+        
+        try:
+            title, size = self._try_ytdlp_metadata(proxy_url)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            log.debug("yt-dlp attempt failed (%s): %s", proxy_url or 'direct', e)
+            # A kill from cancel() or a finished race says nothing about the proxy
+            if proxy_url and not self._race_over:
+                self._mark_failed(proxy_url, e)
+            return proxy_url, None, 0
+        return proxy_url, title, size
+
+    def _race_ytdlp_metadata(self):
+        """
+        Run the direct yt-dlp attempt and up to three proxied ones concurrently.
+        Returns: (title, size) from the first attempt that succeeds, or (None, 0)
+        """
+        if self._cancelled:
+            return None, 0
+        self._race_over = False
+        self._direct_failed = False
+        self._raced_proxies.clear()
+        pool = ThreadPoolExecutor(max_workers=1 + self._PROXY_ATTEMPTS)
+        direct = pool.submit(self._race_attempt, False)
+        pending = {direct}
+        pending.update(pool.submit(self._race_attempt, True)
+                       for _ in range(self._PROXY_ATTEMPTS))
+        proxy_failures = 0
+        self.signals.status.emit("Fetching video info...")
+        
+        try:
+            while pending and not self._cancelled:
+                # Proxy lookups can block on a refresh, so poll for cancel
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in done:
+                    proxy_url, title, size = future.result()
+                    if title:
+                        if proxy_url:
+                            self._mark_success(proxy_url)
+                        return title, size
+                    
+                    if future is direct:
+                        self._direct_failed = True
+                    else:
+                        proxy_failures += 1
+                    # Proxy progress only matters once the direct attempt is out
+                    if (self._direct_failed and pending and not self._cancelled
+                            and proxy_failures < len(self._PROXY_STATUS)):
+                        self.signals.status.emit(self._PROXY_STATUS[proxy_failures])
+            
+            return None, 0
+        finally:
+            self._kill_ytdlp()
+            pool.shutdown(wait=False)
+
+    def _mark_success(self, proxy_url):
+        """Close the proxy's breaker and tell proxy_manager it worked"""
+        _record_proxy_result(proxy_url, ok=True)
+        try:
+            if proxy_manager is not None:
+                proxy_manager.mark_proxy_success(proxy_url)
+        except Exception:
+            pass
+
+    def _mark_failed(self, proxy_url, error):
+        """Count a failure against the proxy; only network errors trip its breaker"""
+        if isinstance(error, (ConnectionError, subprocess.TimeoutExpired)):
+            _record_proxy_result(proxy_url, ok=False)
+        try:
+            if proxy_manager is not None:
+                proxy_manager.mark_proxy_failed(proxy_url)
+        except Exception:
+            pass
+
+    def _kill_ytdlp(self):
+        """Stop every yt-dlp process still running for this fetch"""
+        with self._procs_lock:
+            self._race_over = True
+            procs = list(self._procs)
+        for proc in procs:
+            try:
+                proc.kill()
+            except OSError:
+                pass
+
     def run(self):
         try:
-            print(f"DEBUG: MetadataFetcher started for: {self.url[:60]}...")
+            self._run()
+        finally:
+            _ACTIVE_FETCHERS.discard(self)
+
+    def _run(self):
+        cached = metadata_cache.get(self.url)
+        if cached:
+            log.debug("Metadata cache hit: %s, %s", cached[0], cached[1])
+            self._emit_result(*cached)
+            return
+        
+        try:
+            name, size, fallback = self.fetch_metadata()
+        except Exception:
+            log.exception("MetadataFetcher failed for %.60s", self.url)
+            name, size, fallback = f"download_{int(time.time())}.mp4", 0, True
+        
+        if self._cancelled:
+            return
+        
+        # A generated name or an unknown size means the lookup fell back to a
+        # guess; keep that only briefly so a retry soon after doesn't repeat
+        # the whole run, but a later one still gets the real name
+        metadata_cache.set(self.url, name, size, failed=fallback or size <= 0)
+        self._emit_result(name, size)
+
+    def fetch_metadata(self):
+        """
+        Resolve the filename and size for self.url.
+        Returns: (name, size, fallback) - size is 0 when unknown, fallback is
+        True when the name was generated rather than found
+        """
+        log.debug("MetadataFetcher started for: %.60s...", self.url)
+        
+        # Parse and lowercase once; every check below reuses these
+        parsed = urlparse(self.url)
+        url_lc = self.url.lower()
+        netloc_lc = parsed.netloc.lower()
+        query = parse_qs(parsed.query)
+        
+        name = "download.file"
+        size = 0
+        
+        # ═══════════════════════════════════════════════════════════════════
+        # YOUTUBE HANDLING
+        # ═══════════════════════════════════════════════════════════════════
+        is_youtu_be = netloc_lc in ("youtu.be", "www.youtu.be")
+        if is_youtu_be or (netloc_lc.endswith("youtube.com") and parsed.path.startswith("/watch")):
+            # The video ID is enough for a usable name, so hand that to the
+            # dialog right away and follow up once yt-dlp has the title
+            if is_youtu_be:
+                video_id = parsed.path.lstrip("/").partition("/")[0][:11]
+            else:
+                video_id = query.get("v", [""])[0][:11]
             
-            def sanitize(n):
-                """Clean filename of invalid characters"""
-                if not n:
-                    return ""
-                keep = (" ", ".", "_", "-", "(", ")", "[", "]")
-                result = "".join(c for c in n if c.isalnum() or c in keep).strip()
-                # Remove multiple spaces
-                while "  " in result:
-                    result = result.replace("  ", " ")
-                return result[:200]  # Limit length
-
-            from urllib.parse import urlparse, unquote, parse_qs
-            parsed = urlparse(self.url)
+            if video_id:
+                self._emit_provisional(f"youtube_{video_id}.mp4")
             
-            name = "download.file"
-            size = 0
+            self.signals.status.emit("Getting video info...")
             
-            # ═══════════════════════════════════════════════════════════════════
-            # YOUTUBE HANDLING
-            # ═══════════════════════════════════════════════════════════════════
-            if "youtube.com/watch" in self.url or "youtu.be/" in self.url:
-                self.status.emit("Getting video info...")
-                
-                # Attempt 1: Direct connection (no proxy)
-                try:
-                    print("DEBUG: Attempt 1 - Direct yt-dlp...")
-                    self.status.emit("Fetching video info...")
-                    title, size = self._try_ytdlp_metadata(proxy_url=None)
-                    
-                    if title:
-                        name = sanitize(title) + ".mp4"
-                        print(f"DEBUG: Direct success: {name}, {size}")
-                        self.finished.emit(name, size)
-                        return
-                        
-                except ConnectionError as e:
-                    print(f"DEBUG: Direct blocked: {e}")
-                    self.status.emit("Direct connection blocked...")
-                except subprocess.TimeoutExpired:
-                    print("DEBUG: Direct connection timed out")
-                    self.status.emit("Connection timed out...")
-                except FileNotFoundError:
-                    print("DEBUG: yt-dlp not installed!")
-                    self.status.emit("yt-dlp not found")
-                    self.finished.emit("youtube_video.mp4", 0)
-                    return
-                except Exception as e:
-                    print(f"DEBUG: Direct attempt failed: {e}")
-                
-                # Attempt 2: First proxy
-                self.status.emit("Finding proxy...")
-                proxy_url = self._get_working_proxy()
-                
-                if proxy_url:
-                    try:
-                        print(f"DEBUG: Attempt 2 - Proxy: {proxy_url[:40]}...")
-                        self.status.emit("Using proxy for info...")
-                        title, size = self._try_ytdlp_metadata(proxy_url=proxy_url)
-                        
-                        if title:
-                            name = sanitize(title) + ".mp4"
-                            print(f"DEBUG: Proxy success: {name}, {size}")
-                            
-                            # Mark proxy as good
-                            try:
-                                from core.proxy_manager import proxy_manager
-                                proxy_manager.mark_proxy_success(proxy_url)
-                            except:
-                                pass
-                            
-                            self.finished.emit(name, size)
-                            return
-                            
-                    except Exception as e:
-                        print(f"DEBUG: Proxy 1 failed: {e}")
-                        try:
-                            from core.proxy_manager import proxy_manager
-                            proxy_manager.mark_proxy_failed(proxy_url)
-                        except:
-                            pass
-                
-                # Attempt 3: Second proxy
-                self.status.emit("Trying another proxy...")
-                proxy_url = self._get_working_proxy()
-                
-                if proxy_url:
-                    try:
-                        print(f"DEBUG: Attempt 3 - Proxy: {proxy_url[:40]}...")
-                        title, size = self._try_ytdlp_metadata(proxy_url=proxy_url)
-                        
-                        if title:
-                            name = sanitize(title) + ".mp4"
-                            print(f"DEBUG: Proxy 2 success: {name}")
-                            
-                            try:
-                                from core.proxy_manager import proxy_manager
-                                proxy_manager.mark_proxy_success(proxy_url)
-                            except:
-                                pass
-                            
-                            self.finished.emit(name, size)
-                            return
-                            
-                    except Exception as e:
-                        print(f"DEBUG: Proxy 2 failed: {e}")
-                        try:
-                            from core.proxy_manager import proxy_manager
-                            proxy_manager.mark_proxy_failed(proxy_url)
-                        except:
-                            pass
-                
-                # Attempt 4: Third proxy
-                self.status.emit("Last proxy attempt...")
-                proxy_url = self._get_working_proxy()
-                
-                if proxy_url:
-                    try:
-                        print(f"DEBUG: Attempt 4 - Proxy: {proxy_url[:40]}...")
-                        title, size = self._try_ytdlp_metadata(proxy_url=proxy_url)
-                        
-                        if title:
-                            name = sanitize(title) + ".mp4"
-                            self.finished.emit(name, size)
-                            return
-                    except:
-                        pass
-                
-                # All attempts failed - use fallback name
-                print("DEBUG: All metadata attempts failed, using fallback name")
-                self.status.emit("Using default name...")
-                
-                # Try to extract video ID for better naming
-                video_id = ""
-                try:
-                    if "v=" in self.url:
-                        video_id = self.url.split("v=")[1].split("&")[0][:11]
-                    elif "youtu.be/" in self.url:
-                        video_id = self.url.split("youtu.be/")[1].split("?")[0][:11]
-                except:
-                    pass
-                
-                if video_id:
-                    name = f"youtube_{video_id}.mp4"
-                else:
-                    name = f"youtube_video_{int(time.time())}.mp4"
-                
-                self.finished.emit(name, 0)
-                return
+            try:
+                title, size = self._race_ytdlp_metadata()
+            except FileNotFoundError:
+                log.warning("yt-dlp not installed!")
+                self.signals.status.emit("yt-dlp not found")
+                return "youtube_video.mp4", 0, True
             
-            # ═══════════════════════════════════════════════════════════════════
-            # NON-YOUTUBE URLs
-            # ═══════════════════════════════════════════════════════════════════
+            if title:
+                name = _sanitize_filename(title) + ".mp4"
+                log.debug("yt-dlp success: %s, %s", name, size)
+                return name, size, False
             
-            self.status.emit("Getting file info...")
+            # All attempts failed - use fallback name
+            log.debug("All metadata attempts failed, using fallback name")
+            self.signals.status.emit("Using default name...")
             
-            # Check for 'clen' in URL (common in direct video streams)
-            query = parse_qs(parsed.query)
-            if 'clen' in query:
-                try:
-                    size = int(query['clen'][0])
-                    print(f"DEBUG: Found size in URL (clen): {size}")
-                except:
-                    pass
+            if video_id:
+                name = f"youtube_{video_id}.mp4"
+            else:
+                name = f"youtube_video_{int(time.time())}.mp4"
+            
+            return name, 0, True
+        
+        # ═══════════════════════════════════════════════════════════════════
+        # NON-YOUTUBE URLs
+        # ═══════════════════════════════════════════════════════════════════
+        
+        self.signals.status.emit("Getting file info...")
+        
+        # Check for 'clen' in URL (common in direct video streams)
+        if 'clen' in query:
+            try:
+                size = int(query['clen'][0])
+                log.debug("Found size in URL (clen): %s", size)
+            except (ValueError, IndexError):
+                pass
 
-            # Try to extract name from URL path
-            path_name = parsed.path.split('/')[-1]
-            if path_name:
-                decoded_name = unquote(path_name)
-                # Use if it looks like a real filename
-                if "videoplayback" not in decoded_name.lower() and "." in decoded_name:
-                    name = decoded_name
-                    print(f"DEBUG: Name from URL path: {name}")
-
-            # Network request for additional metadata
-            if size == 0 or name == "download.file":
-                try:
-                    print("DEBUG: Fetching headers...")
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Accept-Encoding': 'identity',  # Don't use gzip for range requests
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1'
-                    }
+        # Try to extract name from URL path
+        path_name = parsed.path.rpartition('/')[2]
+        if path_name:
+            decoded_name = unquote(path_name)
+            # Use if it looks like a real filename
+            if "videoplayback" not in decoded_name.lower() and "." in decoded_name:
+                name = decoded_name
+                log.debug("Name from URL path: %s", name)
+
+        # The URL alone already gave a real filename and size - no request needed
+        if name != "download.file" and size > 0:
+            clean_name = _sanitize_filename(name)
+            if clean_name:
+                return clean_name, size, False
+            return f"download_{int(time.time())}.file", size, True
+        
+        # googlevideo streams carry their size in clen and never answer HEAD
+        # with a useful name, so the round trip buys nothing
+        if 'googlevideo' in netloc_lc and 'clen' in query:
+            return f"video_{int(time.time())}.mp4", size, True
+
+        # Network request for additional metadata
+        if size == 0 or name == "download.file":
+            try:
+                log.debug("Fetching headers...")
+                
+                # GitHub release assets redirect to signed CDN URLs that may
+                # refuse HEAD, so fall back to a one-byte Range GET for those
+                is_github = netloc_lc.endswith('github.com') and '/releases/download/' in parsed.path.lower()
+                
+                if is_github:
+                    log.debug("GitHub release detected - trying HEAD first...")
+                    log.debug("Full requesting URL: %s", self.url)  # FULL URL
+                    response = _HTTP.head(self.url, allow_redirects=True, timeout=8)
+                    if response.status_code in (403, 405):
+                        log.debug("HEAD refused (%s) - using GET with Range header...", response.status_code)
+                        response = _HTTP.get(self.url, headers=_RANGE_HEADERS, stream=True, timeout=8, allow_redirects=True)
+                        if response.status_code == 206:
+                            # Reading the single byte lets the connection go back to the pool
+                            _ = response.content
+                        response.close()
                     
-                    # GitHub releases don't support HEAD properly - use GET with Range
-                    is_github = 'github.com' in self.url.lower() and '/releases/download/' in self.url.lower()
+                    log.debug("Final URL: %.100s", response.url)
+                    log.debug("Status code: %s", response.status_code)
                     
-                    if is_github:
-                        print("DEBUG: GitHub release detected - using GET with Range header...")
-                        print(f"DEBUG: Full requesting URL: {self.url}")  # FULL URL
-                        headers['Range'] = 'bytes=0-1'
-                        response = requests.get(self.url, headers=headers, stream=True, timeout=8, allow_redirects=True)
+                    if response.status_code in [200, 206]:  # 206 = Partial Content
+                        # Get size from Content-Range or Content-Length
+                        if 'Content-Range' in response.headers:
+                            # Format: bytes 0-0/TOTAL_SIZE
+                            size = int(response.headers['Content-Range'].rpartition('/')[2])
+                            log.debug("Size from Content-Range: %s", size)
+                        elif 'Content-Length' in response.headers:
+                            size = int(response.headers['Content-Length'])
+                            log.debug("Size from Content-Length: %s", size)
                         
-                        print(f"DEBUG: Final URL: {response.url[:100]}")
-                        print(f"DEBUG: Status code: {response.status_code}")
-                        
-                        if response.status_code in [200, 206]:  # 206 = Partial Content
-                            # Get size from Content-Range or Content-Length
-                            if 'Content-Range' in response.headers:
-                                # Format: bytes 0-1/TOTAL_SIZE
-                                size = int(response.headers['Content-Range'].split('/')[-1])
-                                print(f"DEBUG: Size from Content-Range: {size}")
-                            elif 'Content-Length' in response.headers:
-                                size = int(response.headers['Content-Length'])
-                                print(f"DEBUG: Size from Content-Length: {size}")
-                            
-                            # Get filename from Content-Disposition
-                            if 'Content-Disposition' in response.headers:
-                                import re
-                                cd = response.headers['Content-Disposition']
-                                fname_match = re.findall(r'filename[*]?=["\']?([^"\';]+)', cd)
-                                if fname_match:
-                                    name = unquote(fname_match[0].strip())
-                                    print(f"DEBUG: Name from Content-Disposition: {name}")
-                        else:
-                            print(f"DEBUG: ⚠️ HTTP error {response.status_code}")
-                        
-                        response.close()
+                        # Get filename from Content-Disposition
+                        if 'Content-Disposition' in response.headers:
+                            m = _CD_FILENAME_RE.search(response.headers['Content-Disposition'])
+                            if m:
+                                name = unquote(m.group(1).strip())
+                                log.debug("Name from Content-Disposition: %s", name)
                     else:
-                        # Standard HEAD request for non-GitHub URLs
-                        head = requests.head(
-                            self.url, 
-                            headers=headers, 
-                            allow_redirects=True, 
-                            timeout=8
-                        )
-                        
-                        print(f"DEBUG: Final URL after redirects: {head.url[:100]}")
-                        print(f"DEBUG: Status code: {head.status_code}")
-                        print(f"DEBUG: Content-Length header: {head.headers.get('content-length', 'NOT FOUND')}")
-                        
-                        # Check for errors
-                        if head.status_code == 404:
-                            print("DEBUG: ⚠️ File not found (404) - URL may be invalid or private")
-                            size = 0
-                        elif head.status_code >= 400:
-                            print(f"DEBUG: ⚠️ HTTP error {head.status_code}")
-                            size = 0
-                        
-                        # Try Content-Disposition header for filename
-                        if head.status_code == 200 and "Content-Disposition" in head.headers:
-                            import re
-                            cd = head.headers["Content-Disposition"]
-                            fname_match = re.findall(r'filename[*]?=["\']?([^"\';]+)', cd)
-                            if fname_match:
-                                clean_name = unquote(fname_match[0].strip())
-                                if clean_name:
-                                    name = clean_name
-                                    print(f"DEBUG: Name from Content-Disposition: {name}")
-                        
-                        # Get size from Content-Length
-                        if size == 0 and head.status_code == 200:
-                            content_len = head.headers.get('content-length', '0')
-                            try:
-                                size = int(content_len)
-                                if size > 0:
-                                    print(f"DEBUG: Size from headers: {size}")
-                            except (ValueError, TypeError):
-                                print(f"DEBUG: Failed to parse content-length: '{content_len}'")
-                        
-                except requests.exceptions.Timeout:
-                    print("DEBUG: HEAD request timed out")
-                except Exception as e:
-                    print(f"DEBUG: HEAD request failed: {e}")
+                        log.warning("HTTP error %s", response.status_code)
+                else:
+                    # Standard HEAD request for non-GitHub URLs
+                    head = _HTTP.head(self.url, allow_redirects=True, timeout=8)
+                    
+                    log.debug("Final URL after redirects: %.100s", head.url)
+                    log.debug("Status code: %s", head.status_code)
+                    log.debug("Content-Length header: %s", head.headers.get('content-length', 'NOT FOUND'))
                     
-                    # Fallback: Try GET with Range header
-                    if size == 0:
+                    # Check for errors
+                    if head.status_code == 404:
+                        log.warning("File not found (404) - URL may be invalid or private")
+                        size = 0
+                    elif head.status_code >= 400:
+                        log.warning("HTTP error %s", head.status_code)
+                        size = 0
+                    
+                    # Try Content-Disposition header for filename
+                    if head.status_code == 200 and "Content-Disposition" in head.headers:
+                        m = _CD_FILENAME_RE.search(head.headers["Content-Disposition"])
+                        if m:
+                            clean_name = unquote(m.group(1).strip())
+                            if clean_name:
+                                name = clean_name
+                                log.debug("Name from Content-Disposition: %s", name)
+                    
+                    # Get size from Content-Length
+                    if size == 0 and head.status_code == 200:
+                        content_len = head.headers.get('content-length', '0')
                         try:
-                            headers = {
-                                'User-Agent': 'Mozilla/5.0',
-                                'Range': 'bytes=0-1'
-                            }
-                            with requests.get(self.url, headers=headers, stream=True, timeout=8) as r:
-                                if "Content-Range" in r.headers:
-                                    # Format: bytes 0-1/TOTAL
-                                    size = int(r.headers["Content-Range"].split('/')[-1])
-                                    print(f"DEBUG: Size from Content-Range: {size}")
-                        except:
-                            pass
-
-            # Final cleanup
-            if "videoplayback" in name.lower() or name == "download.file":
-                if "googlevideo" in self.url.lower():
-                    name = f"video_{int(time.time())}.mp4"
-            
-            name = sanitize(name)
-            if not name:
-                name = f"download_{int(time.time())}"
-            
-            # Ensure extension
-            if '.' not in name:
-                # Guess extension from Content-Type if we had it
-                name += ".mp4" if "video" in self.url.lower() else ".file"
+                            size = int(content_len)
+                            if size > 0:
+                                log.debug("Size from headers: %s", size)
+                        except (ValueError, TypeError):
+                            log.debug("Failed to parse content-length: '%s'", content_len)
+                    
+            except requests.exceptions.Timeout:
+                log.debug("HEAD request timed out")
+            except Exception as e:
+                log.debug("HEAD request failed: %s", e)
                 
-            print(f"DEBUG: MetadataFetcher complete: {name}, {size}")
-            self.finished.emit(name, size)
+                # Fallback: Try GET with Range header
+                if size == 0:
+                    try:
+                        with _HTTP.get(self.url, headers=_RANGE_HEADERS, stream=True, timeout=8) as r:
+                            if "Content-Range" in r.headers:
+                                # Format: bytes 0-0/TOTAL
+                                size = int(r.headers["Content-Range"].rpartition('/')[2])
+                                log.debug("Size from Content-Range: %s", size)
+                    except (requests.RequestException, ValueError, OSError):
+                        pass
+
+        # Final cleanup
+        fallback = name == "download.file"
+        if "videoplayback" in name.lower() or fallback:
+            if "googlevideo" in netloc_lc:
+                name = f"video_{int(time.time())}.mp4"
+                fallback = True
+        
+        name = _sanitize_filename(name)
+        if not name:
+            name = f"download_{int(time.time())}"
+            fallback = True
+        
+        # Ensure extension
+        if '.' not in name:
+            # Guess extension from Content-Type if we had it
+            name += ".mp4" if "video" in url_lc else ".file"
             
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            print(f"CRITICAL ERROR in MetadataFetcher: {e}")
-            self.finished.emit(f"download_{int(time.time())}.mp4", 0)
+        log.debug("MetadataFetcher complete: %s, %s", name, size)
+        return name, size, fallback
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -453,6 +830,9 @@ class BaseDialog(QDialog):
         
         self._icon_type = icon_type
         self._drag_pos = None
+        self._applied_theme_version = None
+        # Child widgets with their own apply_theme(), restyled with the dialog
+        self._themable = []
         
         # Main container for shadow effect
         self.container = Card(self, shadow=True)
@@ -470,7 +850,8 @@ class BaseDialog(QDialog):
         # Title bar
         self._create_title_bar(title, icon_type)
         
-        self.apply_theme()
+        # Styling is left to the subclass or the first show, once every
+        # child widget exists
         
     def _create_title_bar(self, title: str, icon_type: IconType = None):
         self.title_bar_layout = QHBoxLayout()
@@ -480,6 +861,7 @@ class BaseDialog(QDialog):
         if icon_type:
             self.title_icon = IconLabel(icon_type, 28)
             self.title_bar_layout.addWidget(self.title_icon)
+            self._themable.append(self.title_icon)
         
         self.title_label = QLabel(title)
         self.title_label.setFont(QFont("Segoe UI", 18, QFont.DemiBold))
@@ -491,17 +873,33 @@ class BaseDialog(QDialog):
         self.close_btn.setFixedSize(36, 36)
         self.close_btn.clicked.connect(self.reject)
         self.title_bar_layout.addWidget(self.close_btn)
+        self._themable.append(self.close_btn)
         
         self.main_layout.addLayout(self.title_bar_layout)
         
+    def _theme_is_current(self) -> bool:
+        """Check if the active theme has already been applied to this dialog"""
+        return self._applied_theme_version == theme.version
+        
+    def _dialog_stylesheet(self) -> str:
+        """Extra dialog-level rules appended to the shared dialog stylesheet"""
+        return ""
+        
     def apply_theme(self):
-        t = theme.current
-        self.setStyleSheet(theme.get_dialog_stylesheet())
+        if self._theme_is_current():
+            return
+        # The title label takes its colour from the dialog-level QLabel rule
+        self.setStyleSheet(theme.get_dialog_stylesheet() + self._dialog_stylesheet())
         self.container.apply_theme()
-        self.title_label.setStyleSheet(f"color: {t['text_primary']}; background: transparent;")
-        self.close_btn.apply_theme()
-        if hasattr(self, 'title_icon'):
-            self.title_icon.apply_theme()
+        for widget in self._themable:
+            widget.apply_theme()
+        self._applied_theme_version = theme.version
+        
+    def showEvent(self, event):
+        # No-op when already styled; catches dialogs built up front and shown
+        # later, including after a theme switch in between
+        self.apply_theme()
+        super().showEvent(event)
         
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -519,6 +917,30 @@ class BaseDialog(QDialog):
 #                         NEW DOWNLOAD DIALOG
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@theme.register_stylesheet
+def _build_new_download_styles(t: dict) -> str:
+    """Build the NewDownloadDialog URL input rules for a theme palette"""
+    return f"""
+        QLineEdit {{
+            background: {t['bg_tertiary']};
+            border: 2px solid {t['border_primary']};
+            border-radius: 10px;
+            padding: 12px 16px;
+            color: {t['text_primary']};
+            font-size: 13px;
+        }}
+        QLineEdit:hover {{
+            border-color: {t['border_primary']};
+        }}
+        QLineEdit:focus {{
+            border-color: {t['accent_primary']};
+        }}
+        QLineEdit::placeholder {{
+            color: {t['text_muted']};
+        }}
+    """
+
+
 class NewDownloadDialog(BaseDialog):
     """Dialog for entering a new download URL"""
     
@@ -565,47 +987,68 @@ class NewDownloadDialog(BaseDialog):
         
         self.main_layout.addLayout(btn_layout)
         
+        self._themable.extend((self.url_icon, self.cancel_btn, self.ok_btn))
         self.apply_theme()
 
     def get_url(self):
         return self.url_input.text().strip()
         
-    def apply_theme(self):
-        super().apply_theme()
-        t = theme.current
-        
-        # Guard against being called before widgets are created
-        if hasattr(self, 'url_icon'):
-            self.url_icon.apply_theme()
-        if hasattr(self, 'cancel_btn'):
-            self.cancel_btn.apply_theme()
-        if hasattr(self, 'ok_btn'):
-            self.ok_btn.apply_theme()
-        
-        # Style URL input
-        if hasattr(self, 'url_input'):
-            self.url_input.setStyleSheet(f"""
-                QLineEdit {{
-                    background: {t['bg_tertiary']};
-                    border: 2px solid {t['border_primary']};
-                    border-radius: 10px;
-                    padding: 12px 16px;
-                    color: {t['text_primary']};
-                    font-size: 13px;
-                }}
-                QLineEdit:focus {{
-                    border-color: {t['accent_primary']};
-                }}
-                QLineEdit::placeholder {{
-                    color: {t['text_muted']};
-                }}
-            """)
+    def _dialog_stylesheet(self) -> str:
+        return theme.compiled_stylesheet(_build_new_download_styles)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #                      DOWNLOAD CONFIRMATION DIALOG
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@theme.register_stylesheet
+def _build_confirm_styles(t: dict) -> str:
+    """Build the DownloadConfirmationDialog field and input rules for a theme palette"""
+    return f"""
+        QLabel[class="field-label"] {{
+            color: {t['text_muted']};
+            font-weight: 600;
+        }}
+        QLabel[class="quality-value"] {{
+            color: {t['accent_primary']};
+            font-weight: 600;
+        }}
+        QLabel[class="size-value"] {{
+            color: {t['accent_primary']};
+            font-weight: 700;
+        }}
+        QLabel[class="size-value"][state="unknown"] {{
+            color: {t['text_muted']};
+            font-weight: 500;
+        }}
+        QLabel[class="status-value"] {{
+            color: {t['text_secondary']};
+            font-style: italic;
+        }}
+        QLabel[class="status-value"][state="ready"] {{
+            color: {t['accent_success']};
+        }}
+        QLineEdit {{
+            background: {t['bg_tertiary']};
+            border: 1px solid {t['border_primary']};
+            border-radius: 8px;
+            padding: 10px 14px;
+            color: {t['text_primary']};
+            font-size: 13px;
+        }}
+        QLineEdit:hover {{
+            border-color: {t['border_primary']};
+        }}
+        QLineEdit:focus {{
+            border-color: {t['accent_primary']};
+        }}
+        QLineEdit:read-only {{
+            background: {t['bg_secondary']};
+            color: {t['text_secondary']};
+        }}
+    """
+
+
 class DownloadConfirmationDialog(BaseDialog):
     """Dialog to confirm download details before starting"""
     
@@ -617,13 +1060,14 @@ class DownloadConfirmationDialog(BaseDialog):
         self.auto_start = True
         self._detected_size = 0
         self._fetcher = None
+        self._fetched_name = None
         
         # Store quality/itag from extension
         self.quality = quality
         self.itag = itag
         
-        print(f"DEBUG: DownloadConfirmationDialog for: {url[:50]}...")
-        print(f"DEBUG: Quality={quality}, Itag={itag}")
+        log.debug("DownloadConfirmationDialog for: %.50s...", url)
+        log.debug("Quality=%s, Itag=%s", quality, itag)
         
         # Parse filesize safely
         try:
@@ -637,8 +1081,6 @@ class DownloadConfirmationDialog(BaseDialog):
         if len(url) > 50:
             display_url = url[:50] + "..."
         
-        t = theme.current
-        
         # File Info Section
         info_section = SectionHeader("FILE INFORMATION", IconType.FILE)
         self.main_layout.addWidget(info_section)
@@ -650,7 +1092,7 @@ class DownloadConfirmationDialog(BaseDialog):
         
         # URL Row
         url_label = QLabel("URL")
-        url_label.setStyleSheet(f"color: {t['text_muted']}; font-weight: 600;")
+        url_label.setProperty("class", "field-label")
         info_grid.addWidget(url_label, 0, 0)
         
         self.url_edit = QLineEdit(display_url)
@@ -660,7 +1102,7 @@ class DownloadConfirmationDialog(BaseDialog):
         
         # Name Row
         name_label = QLabel("File Name")
-        name_label.setStyleSheet(f"color: {t['text_muted']}; font-weight: 600;")
+        name_label.setProperty("class", "field-label")
         info_grid.addWidget(name_label, 1, 0)
         
         initial_name = filename if filename else "Fetching..."
@@ -669,19 +1111,19 @@ class DownloadConfirmationDialog(BaseDialog):
         
         # Quality Row (NEW - shows selected quality)
         quality_label = QLabel("Quality")
-        quality_label.setStyleSheet(f"color: {t['text_muted']}; font-weight: 600;")
+        quality_label.setProperty("class", "field-label")
         info_grid.addWidget(quality_label, 2, 0)
         
         quality_display = quality if quality else "Best Available"
         if itag:
             quality_display += f" (itag: {itag})"
         self.quality_value = QLabel(quality_display)
-        self.quality_value.setStyleSheet(f"color: {t['accent_primary']}; font-weight: 600;")
+        self.quality_value.setProperty("class", "quality-value")
         info_grid.addWidget(self.quality_value, 2, 1)
         
         # Size Row
         size_label = QLabel("Size")
-        size_label.setStyleSheet(f"color: {t['text_muted']}; font-weight: 600;")
+        size_label.setProperty("class", "field-label")
         info_grid.addWidget(size_label, 3, 0)
         
         size_layout = QHBoxLayout()
@@ -690,7 +1132,7 @@ class DownloadConfirmationDialog(BaseDialog):
         
         size_text = format_bytes(filesize) if filesize > 0 else "Calculating..."
         self.size_value = QLabel(size_text)
-        self.size_value.setStyleSheet(f"font-weight: 700; color: {t['accent_primary']};")
+        self.size_value.setProperty("class", "size-value")
         size_layout.addWidget(self.size_value)
         size_layout.addStretch()
         
@@ -698,11 +1140,11 @@ class DownloadConfirmationDialog(BaseDialog):
         
         # Status Row
         status_label = QLabel("Status")
-        status_label.setStyleSheet(f"color: {t['text_muted']}; font-weight: 600;")
+        status_label.setProperty("class", "field-label")
         info_grid.addWidget(status_label, 4, 0)
         
         self.status_value = QLabel("Ready")
-        self.status_value.setStyleSheet(f"color: {t['text_secondary']}; font-style: italic;")
+        self.status_value.setProperty("class", "status-value")
         info_grid.addWidget(self.status_value, 4, 1)
         
         self.main_layout.addLayout(info_grid)
@@ -716,7 +1158,10 @@ class DownloadConfirmationDialog(BaseDialog):
         path_layout = QHBoxLayout()
         path_layout.setSpacing(14)
         
-        dl_loc = QStandardPaths.writableLocation(QStandardPaths.DownloadLocation)
+        dl_loc = QSettings("FastDownloadManager", "FDM").value(_LAST_DIR_KEY, "", type=str)
+        if not dl_loc or not os.path.isdir(dl_loc):
+            dl_loc = _default_download_dir()
+        _prewarm_dir(dl_loc)
         self.path_edit = QLineEdit(dl_loc)
         path_layout.addWidget(self.path_edit)
         
@@ -750,6 +1195,8 @@ class DownloadConfirmationDialog(BaseDialog):
         
         self.main_layout.addLayout(btn_layout)
         
+        self._themable.extend((self.size_icon, self.browse_btn, self.cancel_btn,
+                               self.later_btn, self.now_btn))
         self.apply_theme()
         
         # Start metadata fetcher
@@ -758,26 +1205,30 @@ class DownloadConfirmationDialog(BaseDialog):
     def _start_metadata_fetch(self):
         """Start fetching metadata in background"""
         self._fetcher = MetadataFetcher(self.url)
-        self._fetcher.finished.connect(self._on_metadata_ready)
-        self._fetcher.status.connect(self._on_metadata_status)
+        self._fetcher.signals.finished.connect(self._on_metadata_ready)
+        self._fetcher.signals.title_updated.connect(self._on_title_updated)
+        self._fetcher.signals.status.connect(self._on_metadata_status)
         self._fetcher.start()
     
+    def _dialog_stylesheet(self) -> str:
+        return theme.compiled_stylesheet(_build_confirm_styles)
+    
     def _on_metadata_status(self, status):
         """Update status label with fetcher progress"""
-        self.status_value.setText(status)
+        _set_text(self.status_value, status)
     
     def _on_metadata_ready(self, name, size):
         """Handle metadata fetch completion"""
-        print(f"DEBUG: Metadata ready: name={name}, size={size}")
-        print(f"DEBUG: Current size in dialog: {self._detected_size}")
+        log.debug("Metadata ready: name=%s, size=%s", name, size)
+        log.debug("Current size in dialog: %s", self._detected_size)
         
-        t = theme.current
         current_name = self.name_edit.text()
         
         # Update name if we got a better one
         if current_name in ["Fetching...", "download.file", ""] or "download_" in current_name:
             if name and name != "download.file":
                 self.name_edit.setText(name)
+                self._fetched_name = name
         
         # CRITICAL: Only update size if we DON'T already have a valid size from extension!
         # The extension provides the size for the SELECTED quality (e.g., 1080p = 200MB)
@@ -785,30 +1236,55 @@ class DownloadConfirmationDialog(BaseDialog):
         if self._detected_size <= 0 and size > 0:
             # We don't have a size yet, use the fetched one
             self._detected_size = size
-            self.size_value.setText(format_bytes(size))
-            self.size_value.setStyleSheet(f"font-weight: 700; color: {t['accent_primary']};")
-            print(f"DEBUG: Updated size from metadata: {size}")
+            _set_text(self.size_value, format_bytes(size))
+            _set_state(self.size_value, "known")
+            log.debug("Updated size from metadata: %s", size)
         elif self._detected_size > 0:
             # We already have size from extension - DON'T OVERWRITE IT!
-            print(f"DEBUG: Keeping extension size: {self._detected_size} (ignoring metadata size: {size})")
+            log.debug("Keeping extension size: %s (ignoring metadata size: %s)", self._detected_size, size)
         elif self.size_value.text() == "Calculating...":
-            self.size_value.setText("Unknown")
-            self.size_value.setStyleSheet(f"font-weight: 500; color: {t['text_muted']};")
+            _set_text(self.size_value, "Unknown")
+            _set_state(self.size_value, "unknown")
         
         # Update status
         if name and name != "download.file":
-            self.status_value.setText("Ready to download")
-            self.status_value.setStyleSheet(f"color: {t['accent_success']};")
+            _set_text(self.status_value, "Ready to download")
+            _set_state(self.status_value, "ready")
         else:
-            self.status_value.setText("Ready (metadata limited)")
-            self.status_value.setStyleSheet(f"color: {t['text_secondary']};")
+            _set_text(self.status_value, "Ready (metadata limited)")
+            _set_state(self.status_value, "limited")
+
+    def _on_title_updated(self, name, size):
+        """Swap in the real title after a provisional result, unless the user edited it"""
+        log.debug("Title updated: name=%s, size=%s", name, size)
+        
+        if name and self._fetched_name and self.name_edit.text() == self._fetched_name:
+            self.name_edit.setText(name)
+            self._fetched_name = name
+        
+        # Same rule as _on_metadata_ready: never overwrite the extension's size
+        if self._detected_size <= 0 and size > 0:
+            self._detected_size = size
+            _set_text(self.size_value, format_bytes(size))
+            _set_state(self.size_value, "known")
+        
+        _set_text(self.status_value, "Ready to download")
+        _set_state(self.status_value, "ready")
 
     def browse_folder(self):
+        start_dir = self.path_edit.text()
+        if not os.path.isdir(start_dir):
+            start_dir = _default_download_dir()
+        # Skip symlink resolution and per-folder icon lookups, which stat
+        # every entry and stall on network mounts
         dir_ = QFileDialog.getExistingDirectory(
-            self, "Select Directory", self.path_edit.text()
+            self, "Select Directory", start_dir,
+            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
+            | QFileDialog.DontUseCustomDirectoryIcons
         )
         if dir_:
             self.path_edit.setText(dir_)
+            QSettings("FastDownloadManager", "FDM").setValue(_LAST_DIR_KEY, dir_)
 
     def on_download_now(self):
         self.auto_start = True
@@ -836,62 +1312,60 @@ class DownloadConfirmationDialog(BaseDialog):
             self.itag      # Add itag
         )
     
+    def _stop_fetcher(self):
+        """Cancel the metadata fetch without waiting for its thread"""
+        if not self._fetcher:
+            return
+        fetcher, self._fetcher = self._fetcher, None
+        # Stop the fetcher from delivering results to a closed dialog
+        fetcher.cancel()
+        try:
+            fetcher.signals.finished.disconnect(self._on_metadata_ready)
+            fetcher.signals.title_updated.disconnect(self._on_title_updated)
+            fetcher.signals.status.disconnect(self._on_metadata_status)
+        except (RuntimeError, TypeError):
+            pass
+
+    def done(self, result):
+        # accept()/reject() don't go through closeEvent
+        self._stop_fetcher()
+        super().done(result)
+
     def closeEvent(self, event):
         """Cleanup on close"""
-        if self._fetcher and self._fetcher.isRunning():
-            self._fetcher.quit()
-            self._fetcher.wait(1000)
+        self._stop_fetcher()
         super().closeEvent(event)
-        
-    def apply_theme(self):
-        super().apply_theme()
-        t = theme.current
-        
-        if hasattr(self, 'size_icon'):
-            self.size_icon.apply_theme()
-        if hasattr(self, 'browse_btn'):
-            self.browse_btn.apply_theme()
-        if hasattr(self, 'cancel_btn'):
-            self.cancel_btn.apply_theme()
-        if hasattr(self, 'later_btn'):
-            self.later_btn.apply_theme()
-        if hasattr(self, 'now_btn'):
-            self.now_btn.apply_theme()
-        
-        # Style inputs
-        input_style = f"""
-            QLineEdit {{
-                background: {t['bg_tertiary']};
-                border: 1px solid {t['border_primary']};
-                border-radius: 8px;
-                padding: 10px 14px;
-                color: {t['text_primary']};
-                font-size: 13px;
-            }}
-            QLineEdit:focus {{
-                border-color: {t['accent_primary']};
-            }}
-            QLineEdit:read-only {{
-                background: {t['bg_secondary']};
-                color: {t['text_secondary']};
-            }}
-        """
-        
-        if hasattr(self, 'url_edit'):
-            self.url_edit.setStyleSheet(input_style)
-        if hasattr(self, 'name_edit'):
-            self.name_edit.setStyleSheet(input_style)
-        if hasattr(self, 'path_edit'):
-            self.path_edit.setStyleSheet(input_style)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #                         DOWNLOAD COMPLETE DIALOG
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Closed DownloadedDialogs kept for reuse, so a batch finishing together
+# doesn't build a fresh dialog per file
+_COMPLETE_DLG_POOL = []
+_COMPLETE_DLG_POOL_MAX = 4
+
+
 class DownloadedDialog(BaseDialog):
     """Dialog shown when a download completes"""
     
+    @classmethod
+    def acquire(cls, task, parent=None):
+        """Reuse a pooled dialog with the same parent, or build a new one"""
+        for dlg in list(_COMPLETE_DLG_POOL):
+            try:
+                reusable = dlg.parent() is parent
+            except RuntimeError:
+                # Deleted along with its parent window
+                _COMPLETE_DLG_POOL.remove(dlg)
+                continue
+            if reusable:
+                _COMPLETE_DLG_POOL.remove(dlg)
+                dlg.reconfigure(task)
+                return dlg
+        return cls(task, parent)
+    
     def __init__(self, task, parent=None):
         super().__init__(parent, "Download Complete", IconType.COMPLETE)
         self.task = task
@@ -907,10 +1381,8 @@ class DownloadedDialog(BaseDialog):
         # Hero Icon (Large Checkmark)
         icon_container = QFrame()
         icon_container.setFixedSize(96, 96)
-        bg_color = QColor(t['accent_success'])
-        bg_color.setAlpha(30)
         icon_container.setStyleSheet(f"""
-            background-color: {bg_color.name(QColor.HexArgb)}; 
+            background-color: {t['accent_success_a30']}; 
             border-radius: 48px;
         """)
         
@@ -935,20 +1407,20 @@ class DownloadedDialog(BaseDialog):
         text_layout.addWidget(title)
         
         # File Name
-        name_label = QLabel(os.path.basename(task.save_path))
-        name_label.setFont(QFont("Segoe UI", 11, QFont.DemiBold))
-        name_label.setStyleSheet(f"color: {t['text_secondary']};")
-        name_label.setAlignment(Qt.AlignCenter)
-        name_label.setWordWrap(True)
-        text_layout.addWidget(name_label)
+        self.name_label = QLabel(task.save_name)
+        self.name_label.setFont(QFont("Segoe UI", 11, QFont.DemiBold))
+        self.name_label.setStyleSheet(f"color: {t['text_secondary']};")
+        self.name_label.setAlignment(Qt.AlignCenter)
+        self.name_label.setWordWrap(True)
+        text_layout.addWidget(self.name_label)
         
         # Path
-        path_label = QLabel(os.path.dirname(task.save_path))
-        path_label.setFont(QFont("Segoe UI", 10))
-        path_label.setStyleSheet(f"color: {t['text_muted']};")
-        path_label.setAlignment(Qt.AlignCenter)
-        path_label.setWordWrap(True)
-        text_layout.addWidget(path_label)
+        self.path_label = QLabel(task.save_dir)
+        self.path_label.setFont(QFont("Segoe UI", 10))
+        self.path_label.setStyleSheet(f"color: {t['text_muted']};")
+        self.path_label.setAlignment(Qt.AlignCenter)
+        self.path_label.setWordWrap(True)
+        text_layout.addWidget(self.path_label)
         
         layout.addLayout(text_layout)
         
@@ -975,47 +1447,81 @@ class DownloadedDialog(BaseDialog):
         self.main_layout.addLayout(btn_layout)
         self.main_layout.addSpacing(16)
         
+        self._themable.extend((self.folder_btn, self.open_btn))
         self.apply_theme()
 
+    def reconfigure(self, task):
+        """Point a pooled dialog at another finished task"""
+        self.task = task
+        self.name_label.setText(task.save_name)
+        self.path_label.setText(task.save_dir)
+        self.apply_theme()
+
+    def done(self, result):
+        super().done(result)
+        # Hand the dialog back for the next completion, or free it
+        if len(_COMPLETE_DLG_POOL) < _COMPLETE_DLG_POOL_MAX:
+            if self not in _COMPLETE_DLG_POOL:
+                _COMPLETE_DLG_POOL.append(self)
+        else:
+            self.deleteLater()
+
     def open_file(self):
-        try:
-            if os.path.exists(self.task.save_path):
-                os.startfile(self.task.save_path)
-            self.accept()
-        except Exception as e:
-            print(f"Error opening file: {e}")
+        _open_in_background(self.task.save_path)
+        self.accept()
 
     def open_folder(self):
-        try:
-            folder = os.path.dirname(self.task.save_path)
-            if os.path.exists(folder):
-                os.startfile(folder)
-            self.accept()
-        except Exception as e:
-            print(f"Error opening folder: {e}")
-    
-    def apply_theme(self):
-        super().apply_theme()
-        if hasattr(self, 'folder_btn'):
-            self.folder_btn.apply_theme()
-        if hasattr(self, 'open_btn'):
-            self.open_btn.apply_theme()
+        _open_in_background(self.task.save_dir)
+        self.accept()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #                           PROGRESS DIALOG
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@theme.register_stylesheet
+def _build_progress_styles(t: dict) -> str:
+    """Build the ProgressDialog detail and status rules for a theme palette"""
+    return f"""
+        QFrame[class="progress-icon"] {{
+            background-color: {t['accent_primary_a30']};
+            border-radius: 24px;
+        }}
+        QLabel[class="progress-label"] {{
+            color: {t['text_muted']};
+            font-weight: 500;
+        }}
+        QLabel[class="progress-value"] {{
+            color: {t['text_secondary']};
+        }}
+        QLabel[class="progress-accent"] {{
+            color: {t['accent_primary']};
+        }}
+        QLabel[class="progress-status"] {{
+            color: {t['text_muted']};
+            font-style: italic;
+        }}
+        QLabel[class="progress-status"][state="downloading"] {{
+            color: {t['accent_primary']};
+            font-style: normal;
+        }}
+        QLabel[class="progress-status"][state="finishing"] {{
+            color: {t['accent_success']};
+            font-style: normal;
+        }}
+    """
+
+
 class ProgressDialog(BaseDialog):
     """Dialog showing download progress"""
     
+    STATS_INTERVAL = 100  # ms
+    
     def __init__(self, task, parent=None):
         super().__init__(parent, "Downloading...", IconType.DOWNLOAD)
         self.task = task
         self.resize(550, 500)
         
-        t = theme.current
-        
         # Main Layout
         layout = QVBoxLayout()
         layout.setSpacing(16)
@@ -1027,22 +1533,16 @@ class ProgressDialog(BaseDialog):
         # Icon container
         icon_container = QFrame()
         icon_container.setFixedSize(48, 48)
-        bg_color = QColor(t['accent_primary'])
-        bg_color.setAlpha(30)
-        icon_container.setStyleSheet(f"""
-            background-color: {bg_color.name(QColor.HexArgb)}; 
-            border-radius: 24px;
-        """)
+        icon_container.setProperty("class", "progress-icon")
         icon_layout = QVBoxLayout(icon_container)
         icon_layout.setContentsMargins(0, 0, 0, 0)
         icon_layout.addWidget(IconLabel(IconType.FILE, 24), 0, Qt.AlignCenter)
         header_layout.addWidget(icon_container)
         
         # Title
-        self.file_header = QLabel(os.path.basename(task.save_path))
+        self.file_header = QLabel(task.save_name)
         self.file_header.setFont(QFont("Segoe UI", 14, QFont.Bold))
         self.file_header.setWordWrap(True)
-        self.file_header.setStyleSheet(f"color: {t['text_primary']};")
         header_layout.addWidget(self.file_header)
         header_layout.addStretch()
         layout.addLayout(header_layout)
@@ -1057,53 +1557,49 @@ class ProgressDialog(BaseDialog):
         def add_row(row, label_text, value_widget):
             lbl = QLabel(label_text)
             lbl.setFont(QFont("Segoe UI", 10))
-            lbl.setStyleSheet(f"color: {t['text_muted']}; font-weight: 500;")
+            lbl.setProperty("class", "progress-label")
             grid.addWidget(lbl, row, 0)
             grid.addWidget(value_widget, row, 1)
 
         # URL
-        display_url = task.url[:50] + "..." if len(task.url) > 50 else task.url
-        self.url_val = QLabel(display_url)
+        self.url_val = ElidedLabel(task.url)
         self.url_val.setFont(QFont("Segoe UI", 10))
-        self.url_val.setStyleSheet(f"color: {t['text_secondary']};")
-        self.url_val.setWordWrap(True)
-        self.url_val.setToolTip(task.url)
+        self.url_val.setProperty("class", "progress-value")
         add_row(0, "File URL:", self.url_val)
         
         # Size
         self.size_val = QLabel(format_bytes(task.file_size) if task.file_size > 0 else "Unknown")
         self.size_val.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        self.size_val.setStyleSheet(f"color: {t['text_primary']};")
         add_row(1, "File Size:", self.size_val)
         
         # Downloaded
         self.downloaded_val = QLabel("0 B")
         self.downloaded_val.setFont(QFont("Segoe UI", 10))
-        self.downloaded_val.setStyleSheet(f"color: {t['accent_primary']};")
+        self.downloaded_val.setProperty("class", "progress-accent")
         add_row(2, "Downloaded:", self.downloaded_val)
         
         # Remaining
         self.remaining_val = QLabel("-")
         self.remaining_val.setFont(QFont("Segoe UI", 10))
-        self.remaining_val.setStyleSheet(f"color: {t['text_secondary']};")
+        self.remaining_val.setProperty("class", "progress-value")
         add_row(3, "Remaining:", self.remaining_val)
         
         # ETA
         self.eta_val = QLabel("Calculating...")
         self.eta_val.setFont(QFont("Segoe UI", 10))
-        self.eta_val.setStyleSheet(f"color: {t['text_secondary']};")
+        self.eta_val.setProperty("class", "progress-value")
         add_row(4, "ETA:", self.eta_val)
         
         # Speed
         self.speed_val = QLabel("-")
         self.speed_val.setFont(QFont("Segoe UI", 10))
-        self.speed_val.setStyleSheet(f"color: {t['accent_primary']};")
+        self.speed_val.setProperty("class", "progress-accent")
         add_row(5, "Transfer Rate:", self.speed_val)
         
         # Status (for proxy info)
         self.status_val = QLabel("Starting...")
         self.status_val.setFont(QFont("Segoe UI", 10))
-        self.status_val.setStyleSheet(f"color: {t['text_muted']}; font-style: italic;")
+        self.status_val.setProperty("class", "progress-status")
         add_row(6, "Status:", self.status_val)
 
         layout.addLayout(grid)
@@ -1138,40 +1634,73 @@ class ProgressDialog(BaseDialog):
         self.main_layout.addLayout(layout)
         self.main_layout.addLayout(btn_layout)
         
-        # Connect signals
-        self.task.progress_updated.connect(self.update_stats)
-        self.task.status_changed.connect(self.on_status_changed)
-        self.task.finished.connect(self.on_finished)
-        
+        # Progress can arrive far faster than it's worth repainting, so keep
+        # only the latest values and apply them every STATS_INTERVAL ms while
+        # the dialog is visible
+        self._pending_stats = None
+        self._shown_stats = None
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(self.STATS_INTERVAL)
+        self._stats_timer.timeout.connect(self._flush_stats)
+        
+        # Threading contract: _queue_stats runs directly in whichever thread
+        # emits progress_updated and only stores a tuple, which is atomic
+        # under the GIL. Everything touching widgets stays queued so it runs
+        # on the UI thread.
+        self.task.progress_updated.connect(self._queue_stats, Qt.DirectConnection)
+        self.task.status_changed.connect(self.on_status_changed, Qt.QueuedConnection)
+        self.task.finished.connect(self.on_finished, Qt.QueuedConnection)
+        
+        self._themable.extend((self.hide_btn, self.pause_btn, self.cancel_btn))
         self.apply_theme()
     
+    def _dialog_stylesheet(self) -> str:
+        return theme.compiled_stylesheet(_build_progress_styles)
+    
     def on_status_changed(self, status):
         """Update status display"""
-        self.status_val.setText(status)
+        _set_text(self.status_val, status)
         
+    def _queue_stats(self, progress, speed, eta):
+        self._pending_stats = (progress, speed, eta)
+
+    def _flush_stats(self):
+        # Compare by identity instead of clearing the slot, so an update
+        # stored mid-flush is never lost
+        stats = self._pending_stats
+        if stats is not None and stats is not self._shown_stats:
+            self._shown_stats = stats
+            self.update_stats(*stats)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._stats_timer.start()
+
+    def hideEvent(self, event):
+        self._stats_timer.stop()
+        super().hideEvent(event)
+
     def update_stats(self, progress, speed, eta):
-        t = theme.current
-        
         # Update progress bar
         self.progress_bar.setValue(progress)
         
         # Update speed
         if speed > 0:
-            self.speed_val.setText(format_speed(speed))
+            _set_text(self.speed_val, format_speed(speed))
         
         # Update ETA
         if eta > 0:
-            self.eta_val.setText(format_time(eta))
+            _set_text(self.eta_val, format_time(eta))
         elif progress >= 100:
-            self.eta_val.setText("Complete")
+            _set_text(self.eta_val, "Complete")
         else:
-            self.eta_val.setText("Calculating...")
+            _set_text(self.eta_val, "Calculating...")
         
         current_size = self.task.downloaded_bytes
         total_size = self.task.file_size
         
         # Update downloaded
-        self.downloaded_val.setText(format_bytes(current_size))
+        _set_text(self.downloaded_val, format_bytes(current_size))
         
         # Update total size if it changed
         if self.size_val.text() in ["Unknown", "0 B"] and total_size > 0:
@@ -1180,24 +1709,24 @@ class ProgressDialog(BaseDialog):
         # Update remaining
         if total_size > 0:
             remaining = max(0, total_size - current_size)
-            self.remaining_val.setText(format_bytes(remaining))
+            _set_text(self.remaining_val, format_bytes(remaining))
         
         # Update status
         if progress > 0 and progress < 100:
-            self.status_val.setText("Downloading...")
-            self.status_val.setStyleSheet(f"color: {t['accent_primary']};")
+            _set_text(self.status_val, "Downloading...")
+            _set_state(self.status_val, "downloading")
         elif progress >= 100:
-            self.status_val.setText("Finishing up...")
-            self.status_val.setStyleSheet(f"color: {t['accent_success']};")
+            _set_text(self.status_val, "Finishing up...")
+            _set_state(self.status_val, "finishing")
 
     def on_finished(self):
         self.accept()
-        dlg = DownloadedDialog(self.task, self.parent())
+        dlg = DownloadedDialog.acquire(self.task, self.parent())
         dlg.show()
         
         # Track dialog in parent if possible
         parent = self.parent()
-        if parent and hasattr(parent, '_active_dialogs'):
+        if parent and hasattr(parent, '_active_dialogs') and dlg not in parent._active_dialogs:
             parent._active_dialogs.append(dlg)
             dlg.destroyed.connect(
                 lambda: parent._active_dialogs.remove(dlg) 
@@ -1221,39 +1750,89 @@ class ProgressDialog(BaseDialog):
         if self.task.status == "Downloading":
             self.task.pause()
         self.reject()
-    
-    def apply_theme(self):
-        super().apply_theme()
-        if hasattr(self, 'hide_btn'):
-            self.hide_btn.apply_theme()
-        if hasattr(self, 'pause_btn'):
-            self.pause_btn.apply_theme()
-        if hasattr(self, 'cancel_btn'):
-            self.cancel_btn.apply_theme()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #                           WELCOME DIALOG
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@theme.register_stylesheet
+def _build_welcome_styles(t: dict) -> str:
+    """Build the WelcomeDialog header, step and path rules for a theme palette"""
+    return f"""
+        QLabel[class="welcome-title"] {{
+            color: {t['text_primary']};
+        }}
+        QLabel[class="welcome-sub"] {{
+            color: {t['text_muted']};
+        }}
+        QLabel[class="step-num"] {{
+            background: {t['accent_primary']};
+            color: white;
+            border-radius: 15px;
+            font-weight: 700;
+            font-size: 13px;
+        }}
+        QLabel[class="step-text"] {{
+            color: {t['text_primary']};
+            font-size: 13px;
+        }}
+        QLabel[class="caption"] {{
+            color: {t['text_muted']};
+            font-size: 11px;
+            font-weight: 600;
+        }}
+        QLineEdit[class="ext-path"] {{
+            background-color: {t['bg_tertiary']};
+            border: 1px solid {t['border_primary']};
+            color: {t['text_secondary']};
+            padding: 8px;
+            border-radius: 6px;
+        }}
+    """
+
+
+def _build_message_box_styles(t: dict) -> str:
+    """Build the rules for the URL-copied message box"""
+    return f"""
+        QMessageBox {{
+            background-color: {t['bg_card']};
+        }}
+        QMessageBox QLabel {{
+            color: {t['text_primary']};
+            font-size: 13px;
+        }}
+        QPushButton {{
+            background-color: {t['accent_primary']};
+            color: #FFFFFF;
+            border: none;
+            border-radius: 6px;
+            padding: 6px 20px;
+            font-weight: 600;
+            min-width: 80px;
+        }}
+        QPushButton:hover {{
+            background-color: {t['accent_secondary']};
+        }}
+    """
+
+
 class WelcomeDialog(BaseDialog):
     """Welcome dialog with browser extension setup instructions"""
-    
+        
     def __init__(self, parent=None):
         super().__init__(parent, "Welcome to Hyper Download Manager", None)
         self.resize(660, 540)
+        self._clipboard = QApplication.clipboard()
+        self._url_msgbox = None
         
         t = theme.current
         
         # Custom Title Icon (Logo)
         self.title_logo = QLabel()
         self.title_logo.setFixedSize(32, 32)
-        self.title_logo.setScaledContents(True)
-        try:
-            from utils.helpers import get_resource_path
-            self.title_logo.setPixmap(QPixmap(get_resource_path("icon.png")))
-        except:
-            pass
+        self.title_logo.setPixmap(_icon_at(32))
+        self.title_logo.setAlignment(Qt.AlignCenter)
         self.title_bar_layout.insertWidget(0, self.title_logo)
         
         # Welcome Header
@@ -1270,12 +1849,8 @@ class WelcomeDialog(BaseDialog):
         
         app_icon = QLabel()
         app_icon.setFixedSize(64, 64)
-        app_icon.setScaledContents(True)
-        try:
-            from utils.helpers import get_resource_path
-            app_icon.setPixmap(QPixmap(get_resource_path("icon.png")))
-        except:
-            pass
+        app_icon.setPixmap(_icon_at(64))
+        app_icon.setAlignment(Qt.AlignCenter)
         icon_container_layout.addWidget(app_icon)
         icon_container.setStyleSheet("QFrame { background-color: transparent; }")
         
@@ -1284,11 +1859,11 @@ class WelcomeDialog(BaseDialog):
         welcome_msg = QLabel("Setup Browser Extension")
         welcome_msg.setFont(QFont("Segoe UI", 18, QFont.DemiBold))
         welcome_msg.setAlignment(Qt.AlignCenter)
-        welcome_msg.setStyleSheet(f"color: {t['text_primary']};")
+        welcome_msg.setProperty("class", "welcome-title")
         welcome_layout.addWidget(welcome_msg)
         
         sub_msg = QLabel("Follow these steps to integrate with your browser")
-        sub_msg.setStyleSheet(f"color: {t['text_muted']};")
+        sub_msg.setProperty("class", "welcome-sub")
         sub_msg.setAlignment(Qt.AlignCenter)
         welcome_layout.addWidget(sub_msg)
         
@@ -1314,23 +1889,16 @@ class WelcomeDialog(BaseDialog):
             num_label = QLabel(str(i))
             num_label.setFixedSize(30, 30)
             num_label.setAlignment(Qt.AlignCenter)
-            num_label.setStyleSheet(f"""
-                background: {t['accent_primary']};
-                color: white;
-                border-radius: 15px;
-                font-weight: 700;
-                font-size: 13px;
-            """)
+            num_label.setProperty("class", "step-num")
             step_layout.addWidget(num_label)
             
             # Step icon
-            step_icon = IconLabel(icon_type, 20)
-            step_icon.set_color(t['text_secondary'])
+            step_icon = IconLabel(icon_type, 20, color=t['text_secondary'])
             step_layout.addWidget(step_icon)
             
             # Step text
             text_label = QLabel(text)
-            text_label.setStyleSheet(f"color: {t['text_primary']}; font-size: 13px;")
+            text_label.setProperty("class", "step-text")
             step_layout.addWidget(text_label)
             step_layout.addStretch()
             
@@ -1341,34 +1909,21 @@ class WelcomeDialog(BaseDialog):
         
         # Extension Path Helper
         path_label = QLabel("Extension Folder Path:")
-        path_label.setStyleSheet(f"color: {t['text_muted']}; font-size: 11px; font-weight: 600;")
+        path_label.setProperty("class", "caption")
         self.main_layout.addWidget(path_label)
         
         path_layout = QHBoxLayout()
         path_layout.setSpacing(10)
         
-        try:
-            from utils.helpers import get_resource_path
-            ext_path = get_resource_path("extension")
-        except:
-            ext_path = os.path.join(os.getcwd(), "extension")
-            
+        ext_path = _extension_path()
         self.ext_path_input = QLineEdit(ext_path)
         self.ext_path_input.setReadOnly(True)
-        self.ext_path_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {t['bg_tertiary']};
-                border: 1px solid {t['border_primary']};
-                color: {t['text_secondary']};
-                padding: 8px;
-                border-radius: 6px;
-            }}
-        """)
+        self.ext_path_input.setProperty("class", "ext-path")
         path_layout.addWidget(self.ext_path_input)
         
         copy_btn = IconButton(IconType.COPY, "Copy Path", variant="secondary")
         copy_btn.setMinimumWidth(100)
-        copy_btn.clicked.connect(lambda: QApplication.clipboard().setText(ext_path))
+        copy_btn.clicked.connect(self._copy_extension_path)
         path_layout.addWidget(copy_btn)
         
         self.main_layout.addLayout(path_layout)
@@ -1379,7 +1934,7 @@ class WelcomeDialog(BaseDialog):
         
         # Browser Buttons
         browser_label = QLabel("Quick Links:")
-        browser_label.setStyleSheet(f"color: {t['text_muted']}; font-size: 11px; font-weight: 600;")
+        browser_label.setProperty("class", "caption")
         self.main_layout.addWidget(browser_label)
         
         browser_layout = QHBoxLayout()
@@ -1387,21 +1942,17 @@ class WelcomeDialog(BaseDialog):
         
         self.chrome_btn = IconButton(IconType.CHROME, "Chrome", variant="secondary")
         self.chrome_btn.setMinimumWidth(110)
-        self.chrome_btn.clicked.connect(lambda: self.show_browser_help("chrome://extensions"))
+        self.chrome_btn.clicked.connect(partial(self.show_browser_help, CHROME_URL))
         browser_layout.addWidget(self.chrome_btn)
         
         self.firefox_btn = IconButton(IconType.FIREFOX, "Firefox", variant="secondary")
         self.firefox_btn.setMinimumWidth(110)
-        self.firefox_btn.clicked.connect(
-            lambda: QDesktopServices.openUrl(
-                QUrl("https://addons.mozilla.org/en-US/firefox/addon/hyper-download-manager/")
-            )
-        )
+        self.firefox_btn.clicked.connect(self._open_firefox)
         browser_layout.addWidget(self.firefox_btn)
         
         self.edge_btn = IconButton(IconType.EDGE, "Edge", variant="secondary")
         self.edge_btn.setMinimumWidth(110)
-        self.edge_btn.clicked.connect(lambda: self.show_browser_help("edge://extensions"))
+        self.edge_btn.clicked.connect(partial(self.show_browser_help, EDGE_URL))
         browser_layout.addWidget(self.edge_btn)
         
         browser_layout.addStretch()
@@ -1411,93 +1962,116 @@ class WelcomeDialog(BaseDialog):
         self.main_layout.addStretch()
         
         # Done Button
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-        
         self.done_btn = IconButton(IconType.CHECK, "Get Started", variant="primary")
         self.done_btn.setMinimumWidth(150)
         self.done_btn.clicked.connect(self.accept)
-        btn_layout.addWidget(self.done_btn)
-        
-        self.main_layout.addLayout(btn_layout)
+        self.main_layout.addWidget(self.done_btn, 0, Qt.AlignRight)
+
+    def _dialog_stylesheet(self) -> str:
+        return theme.compiled_stylesheet(_build_welcome_styles)
 
+    @Slot()
+    def _copy_extension_path(self):
+        self._clipboard.setText(self.ext_path_input.text())
+
+    @Slot()
+    def _open_firefox(self):
+        QDesktopServices.openUrl(_FIREFOX_QURL)
+
+    @Slot(str)
     def show_browser_help(self, url):
-        from PySide6.QtWidgets import QMessageBox
-        
-        clipboard = QApplication.clipboard()
-        clipboard.setText(url)
-        
-        t = theme.current
-        msg = QMessageBox(self)
-        msg.setWindowTitle("URL Copied")
-        msg.setText(f"The URL has been copied to your clipboard:\n\n{url}\n\nPaste it in your browser's address bar.")
-        msg.setIcon(QMessageBox.Information)
-        msg.setStandardButtons(QMessageBox.Ok)
-        
-        msg.setStyleSheet(f"""
-            QMessageBox {{
-                background-color: {t['bg_card']};
-            }}
-            QMessageBox QLabel {{
-                color: {t['text_primary']};
-                font-size: 13px;
-            }}
-            QPushButton {{
-                background-color: {t['accent_primary']};
-                color: #FFFFFF;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 20px;
-                font-weight: 600;
-                min-width: 80px;
-            }}
-            QPushButton:hover {{
-                background-color: {t['accent_secondary']};
-            }}
-        """)
-        msg.exec()
+        self._clipboard.setText(url)
+        
+        # One message box per dialog, only the text changes between clicks
+        if self._url_msgbox is None:
+            self._url_msgbox = QMessageBox(self)
+            self._url_msgbox.setWindowTitle("URL Copied")
+            self._url_msgbox.setIcon(QMessageBox.Information)
+            self._url_msgbox.setStandardButtons(QMessageBox.Ok)
+            self._url_msgbox.setStyleSheet(self._message_box_style())
+        
+        self._url_msgbox.setText(f"The URL has been copied to your clipboard:\n\n{url}\n\nPaste it in your browser's address bar.")
+        self._url_msgbox.exec()
+
+    @staticmethod
+    def _message_box_style() -> str:
+        """Get the message box stylesheet for the current theme, built once per theme"""
+        return theme.compiled_stylesheet(_build_message_box_styles)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #                            ABOUT DIALOG
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# App logo size in AboutDialog
+_LOGO_SIZE = 64
+
+
+# AboutDialog label rules keyed by theme name
+@theme.register_stylesheet
+def _build_about_styles(t: dict) -> str:
+    """Build the AboutDialog label rules for a theme palette"""
+    return f"""
+        QLabel[class="about-name"] {{
+            color: {t['text_primary']};
+            font-size: 18px;
+            font-weight: bold;
+        }}
+        QLabel[class="about-version"] {{
+            color: {t['text_secondary']};
+            font-size: 13px;
+        }}
+        QLabel[class="about-desc"] {{
+            color: {t['text_secondary']};
+            font-size: 13px;
+            line-height: 1.4;
+        }}
+        QLabel[class="about-copy"] {{
+            color: {t['text_muted']};
+            font-size: 11px;
+        }}
+    """
+
+
 class AboutDialog(BaseDialog):
     """About dialog showing app information"""
     
     def __init__(self, parent=None):
         super().__init__(parent, "About", None)
         self.resize(400, 320)
+        self._built = False
         
-        t = theme.current
+    def showEvent(self, event):
+        # Build the content on first show so creating the dialog up front is cheap
+        if not self._built:
+            self._build_ui()
+            self._built = True
+        super().showEvent(event)
+        
+    def _dialog_stylesheet(self) -> str:
+        return theme.compiled_stylesheet(_build_about_styles)
+        
+    def _build_ui(self):
+        # Add everything with layout activation off, then lay out once at the end
+        self.setUpdatesEnabled(False)
+        self.main_layout.setEnabled(False)
         
         # Logo
         logo_label = QLabel()
-        logo_label.setFixedSize(64, 64)
-        logo_label.setScaledContents(True)
-        try:
-            from utils.helpers import get_resource_path
-            logo_label.setPixmap(QPixmap(get_resource_path("icon.png")))
-        except:
-            pass
-        
-        logo_container = QWidget()
-        logo_layout = QHBoxLayout(logo_container)
-        logo_layout.addStretch()
-        logo_layout.addWidget(logo_label)
-        logo_layout.addStretch()
-        self.main_layout.addWidget(logo_container)
+        logo_label.setFixedSize(_LOGO_SIZE, _LOGO_SIZE)
+        logo_label.setPixmap(_icon_at(_LOGO_SIZE))
+        self.main_layout.addWidget(logo_label, 0, Qt.AlignHCenter)
         self.main_layout.addSpacing(16)
         
         # App Name
         name_label = QLabel("Hyper Download Manager")
-        name_label.setStyleSheet(f"color: {t['text_primary']}; font-size: 18px; font-weight: bold;")
+        name_label.setProperty("class", "about-name")
         name_label.setAlignment(Qt.AlignCenter)
         self.main_layout.addWidget(name_label)
         
         # Version
         version_label = QLabel("Version 2.0.0")
-        version_label.setStyleSheet(f"color: {t['text_secondary']}; font-size: 13px;")
+        version_label.setProperty("class", "about-version")
         version_label.setAlignment(Qt.AlignCenter)
         self.main_layout.addWidget(version_label)
         
@@ -1508,7 +2082,7 @@ class AboutDialog(BaseDialog):
             "A high-performance file downloader built with Python and PySide6.\n"
             "Designed for speed, privacy, and simplicity."
         )
-        desc_label.setStyleSheet(f"color: {t['text_secondary']}; font-size: 13px; line-height: 1.4;")
+        desc_label.setProperty("class", "about-desc")
         desc_label.setAlignment(Qt.AlignCenter)
         desc_label.setWordWrap(True)
         self.main_layout.addWidget(desc_label)
@@ -1517,17 +2091,75 @@ class AboutDialog(BaseDialog):
         
         # Copyright
         copy_label = QLabel("© 2025 Hyper Download Manager. All rights reserved.")
-        copy_label.setStyleSheet(f"color: {t['text_muted']}; font-size: 11px;")
+        copy_label.setProperty("class", "about-copy")
         copy_label.setAlignment(Qt.AlignCenter)
         self.main_layout.addWidget(copy_label)
         
         self.main_layout.addSpacing(16)
+        
+        self.main_layout.setEnabled(True)
+        self.setUpdatesEnabled(True)
+        self.main_layout.activate()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #                           UPDATE DIALOG
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@theme.register_stylesheet
+def _build_update_styles(t: dict) -> str:
+    """Build the UpdateDialog label and button rules for a theme palette"""
+    return f"""
+        QLabel[class="update-title"] {{
+            font-family: 'Segoe UI';
+            font-size: 18px;
+            font-weight: 700;
+            color: {t['text_primary']};
+        }}
+        QLabel[class="update-sub"] {{
+            font-family: 'Segoe UI';
+            font-size: 14px;
+            color: {t['text_secondary']};
+        }}
+        QLabel[class="update-note-header"] {{
+            font-family: 'Segoe UI';
+            font-size: 13px;
+            font-weight: 700;
+            color: {t['text_primary']};
+            margin-top: 10px;
+        }}
+        QLabel[class="update-note"] {{
+            font-family: 'Segoe UI';
+            font-size: 13px;
+            color: {t['text_muted']};
+        }}
+        QPushButton[class="update-later"] {{
+            background-color: transparent;
+            border: 1px solid {t['border_primary']};
+            border-radius: 6px;
+            color: {t['text_primary']};
+            font-family: 'Segoe UI';
+            font-weight: 600;
+            font-size: 13px;
+        }}
+        QPushButton[class="update-later"]:hover {{
+            background-color: {t['bg_hover']};
+        }}
+        QPushButton[class="update-now"] {{
+            background-color: {t['accent_primary']};
+            border: none;
+            border-radius: 6px;
+            color: white;
+            font-family: 'Segoe UI';
+            font-weight: 600;
+            font-size: 13px;
+        }}
+        QPushButton[class="update-now"]:hover {{
+            background-color: {t['accent_secondary']};
+        }}
+    """
+
+
 class UpdateDialog(BaseDialog):
     """Dialog shown when an update is available"""
     
@@ -1559,19 +2191,10 @@ class UpdateDialog(BaseDialog):
         info_layout.setSpacing(4)
         
         title = QLabel("New Version Available")
-        title.setStyleSheet(f"""
-            font-family: 'Segoe UI'; 
-            font-size: 18px; 
-            font-weight: 700; 
-            color: {t['text_primary']};
-        """)
+        title.setProperty("class", "update-title")
         
         subtitle = QLabel(f"Version {new_version} is ready to download.")
-        subtitle.setStyleSheet(f"""
-            font-family: 'Segoe UI'; 
-            font-size: 14px; 
-            color: {t['text_secondary']};
-        """)
+        subtitle.setProperty("class", "update-sub")
         
         info_layout.addWidget(title)
         info_layout.addWidget(subtitle)
@@ -1583,24 +2206,14 @@ class UpdateDialog(BaseDialog):
         # Release Note
         if note:
             note_header = QLabel("What's New:")
-            note_header.setStyleSheet(f"""
-                font-family: 'Segoe UI'; 
-                font-size: 13px; 
-                font-weight: 700; 
-                color: {t['text_primary']}; 
-                margin-top: 10px;
-            """)
+            note_header.setProperty("class", "update-note-header")
             layout.addWidget(note_header)
             
         note_text = note if note else "Update to get the latest features and bug fixes."
         note_label = QLabel(note_text)
         note_label.setWordWrap(True)
-        note_label.setStyleSheet(f"""
-            font-family: 'Segoe UI'; 
-            font-size: 13px; 
-            color: {t['text_muted']}; 
-            margin-top: {2 if note else 5}px;
-        """)
+        note_label.setProperty("class", "update-note")
+        note_label.setContentsMargins(0, 2 if note else 5, 0, 0)
         layout.addWidget(note_label)
         
         layout.addStretch()
@@ -1610,12 +2223,14 @@ class UpdateDialog(BaseDialog):
         btn_layout.addStretch()
         
         self.later_btn = QPushButton("Not Now")
+        self.later_btn.setProperty("class", "update-later")
         self.later_btn.setCursor(Qt.PointingHandCursor)
         self.later_btn.setFixedHeight(36)
         self.later_btn.setFixedWidth(100)
         self.later_btn.clicked.connect(self.reject)
         
         self.update_btn = QPushButton("Update Now")
+        self.update_btn.setProperty("class", "update-now")
         self.update_btn.setCursor(Qt.PointingHandCursor)
         self.update_btn.setFixedHeight(36)
         self.update_btn.setFixedWidth(130)
@@ -1627,46 +2242,9 @@ class UpdateDialog(BaseDialog):
         layout.addLayout(btn_layout)
         
         self.main_layout.addWidget(content)
-        self.apply_theme()
-        
-    def apply_theme(self):
-        super().apply_theme()
-        t = theme.current
         
-        if hasattr(self, 'later_btn'):
-            self.later_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: transparent;
-                    border: 1px solid {t['border_primary']};
-                    border-radius: 6px;
-                    color: {t['text_primary']};
-                    font-family: 'Segoe UI';
-                    font-weight: 600;
-                    font-size: 13px;
-                }}
-                QPushButton:hover {{
-                    background-color: {t['bg_hover']};
-                }}
-            """)
-        
-        if hasattr(self, 'update_btn'):
-            bg_color = t.get('accent_primary', '#3B82F6')
-            hover_color = t.get('accent_secondary', t.get('accent_primary', '#2563EB'))
-            
-            self.update_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {bg_color};
-                    border: none;
-                    border-radius: 6px;
-                    color: white;
-                    font-family: 'Segoe UI';
-                    font-weight: 600;
-                    font-size: 13px;
-                }}
-                QPushButton:hover {{
-                    background-color: {hover_color};
-                }}
-            """)
+    def _dialog_stylesheet(self) -> str:
+        return theme.compiled_stylesheet(_build_update_styles)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1749,69 +2327,63 @@ class ProxyStatusDialog(BaseDialog):
         
         self.main_layout.addLayout(btn_layout)
         
-        self.apply_theme()
+        self._themable.extend((self.refresh_btn, self.close_btn))
+        self._elapsed_bucket = -1
         self._update_status()
     
     def _update_status(self):
         """Update status display"""
-        try:
-            from core.proxy_manager import proxy_manager
-            
-            total = proxy_manager.get_proxy_count()
-            working = proxy_manager.get_working_count()
-            
-            self.total_label.setText(str(total))
-            self.working_label.setText(str(working))
-            
-            if proxy_manager._last_refresh > 0:
-                elapsed = int(time.time() - proxy_manager._last_refresh)
-                if elapsed < 60:
-                    self.last_refresh_label.setText(f"{elapsed} seconds ago")
-                elif elapsed < 3600:
-                    self.last_refresh_label.setText(f"{elapsed // 60} minutes ago")
-                else:
-                    self.last_refresh_label.setText(f"{elapsed // 3600} hours ago")
-            else:
-                self.last_refresh_label.setText("Never")
-            
-            if proxy_manager.is_fetching():
-                self.status_label.setText("Fetching proxies...")
-            elif total > 0:
-                self.status_label.setText("Ready")
+        if proxy_manager is None:
+            _set_text(self.total_label, "N/A")
+            _set_text(self.status_label, "Proxy manager not available")
+            return
+        
+        total = proxy_manager.get_proxy_count()
+        working = proxy_manager.get_working_count()
+        
+        _set_text(self.total_label, str(total))
+        _set_text(self.working_label, str(working))
+        
+        # Only reformat the age when it crosses into a new displayed unit
+        if proxy_manager._last_refresh > 0:
+            elapsed = int(time.time() - proxy_manager._last_refresh)
+            if elapsed < 60:
+                bucket = (elapsed, "seconds")
+            elif elapsed < 3600:
+                bucket = (elapsed // 60, "minutes")
             else:
-                self.status_label.setText("No proxies loaded")
-                
-        except ImportError:
-            self.total_label.setText("N/A")
-            self.status_label.setText("Proxy manager not available")
+                bucket = (elapsed // 3600, "hours")
+        else:
+            bucket = None
+        if bucket != self._elapsed_bucket:
+            self._elapsed_bucket = bucket
+            _set_text(self.last_refresh_label, f"{bucket[0]} {bucket[1]} ago" if bucket else "Never")
+        
+        if proxy_manager.is_fetching():
+            _set_text(self.status_label, "Fetching proxies...")
+        elif total > 0:
+            _set_text(self.status_label, "Ready")
+        else:
+            _set_text(self.status_label, "No proxies loaded")
     
     def refresh_proxies(self):
         """Start proxy refresh"""
-        try:
-            from core.proxy_manager import proxy_manager
-            
-            self.refresh_btn.setEnabled(False)
-            self.refresh_btn.setText("Refreshing...")
-            self.status_label.setText("Fetching fresh proxies...")
-            
-            def on_done(success):
-                self.refresh_btn.setEnabled(True)
-                self.refresh_btn.setText("Refresh Proxies")
-                self._update_status()
-                
-                if success:
-                    self.status_label.setText("Refresh complete!")
-                else:
-                    self.status_label.setText("Refresh failed")
-            
-            proxy_manager.refresh_proxies(callback=on_done)
-            
-        except ImportError:
+        if proxy_manager is None:
             self.status_label.setText("Proxy manager not available")
-    
-    def apply_theme(self):
-        super().apply_theme()
-        if hasattr(self, 'refresh_btn'):
-            self.refresh_btn.apply_theme()
-        if hasattr(self, 'close_btn'):
-            self.close_btn.apply_theme()
\ No newline at end of file
+            return
+        
+        self.refresh_btn.setEnabled(False)
+        self.refresh_btn.setText("Refreshing...")
+        self.status_label.setText("Fetching fresh proxies...")
+        
+        def on_done(success):
+            self.refresh_btn.setEnabled(True)
+            self.refresh_btn.setText("Refresh Proxies")
+            self._update_status()
+            
+            if success:
+                self.status_label.setText("Refresh complete!")
+            else:
+                self.status_label.setText("Refresh failed")
+        
+        proxy_manager.refresh_proxies(callback=on_done)
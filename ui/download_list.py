@@ -1,10 +1,13 @@
 from PySide6.QtWidgets import (QTableWidget, QTableWidgetItem, QAbstractItemView, 
                                QHeaderView, QWidget, QHBoxLayout, QVBoxLayout,
                                QLabel, QProgressBar, QStyledItemDelegate, QStyle,
-                               QFrame, QStackedWidget)
-from PySide6.QtCore import Qt, Signal, QRect, QSize, QEvent
-from PySide6.QtGui import QColor, QPainter, QFont, QBrush, QPen, QLinearGradient
+                               QStyleOptionViewItem, QFrame, QStackedWidget)
+from PySide6.QtCore import Qt, Signal, QRect, QSize, QEvent, QTimer
+from PySide6.QtGui import (QColor, QPainter, QFont, QFontMetrics, QBrush, QPen,
+                           QLinearGradient)
 
+import weakref
+from datetime import datetime
 from functools import partial
 from ui.theme_manager import theme
 from ui.icons import IconType, IconProvider, get_pixmap
@@ -12,16 +15,94 @@ from ui.components import StatusBadge, EmptyState
 from utils.helpers import format_bytes, format_speed, format_time
 
 
-class ProgressBarDelegate(QStyledItemDelegate):
+@theme.register_stylesheet
+def _build_table_styles(t: dict) -> str:
+    """Build the download table rules for a theme palette"""
+    return f"""
+        QTableWidget {{
+            background-color: {t['bg_primary']};
+            border: none;
+            font-family: 'Segoe UI';
+            font-size: 13px;
+            color: {t['text_primary']};
+            gridline-color: transparent;
+            outline: none;
+        }}
+    
+        QHeaderView::section {{
+            background-color: {t['bg_primary']};
+            color: {t['text_secondary']};
+            padding: 14px 12px;
+            border: none;
+            border-bottom: 1px solid {t['border_primary']};
+            font-weight: 600;
+            font-size: 11px;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }}
+    
+        QHeaderView::section:hover {{
+            background-color: {t['bg_hover']};
+            color: {t['text_secondary']};
+        }}
+    
+        QHeaderView::section:first {{
+            padding-left: 20px;
+        }}
+    """
+
+
+class RowDelegate(QStyledItemDelegate):
+    """Base delegate that paints the row background itself (alternate tint,
+    selection, hover and divider), keeping the style engine out of each cell"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.refresh_theme()
+    
+    def refresh_theme(self):
+        """Rebuild the cached row colors from the current theme"""
+        t = theme.current
+        self._alt_bg = QColor(t['bg_secondary'])
+        self._selected_bg = QColor(t['bg_selected'])
+        self._hover_bg = QColor(t['bg_hover'])
+        self._divider = QColor(t['border_light'])
+    
+    def paint_row_background(self, painter, option, index):
+        rect = option.rect
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(rect, self._selected_bg)
+        elif option.state & QStyle.State_MouseOver:
+            painter.fillRect(rect, self._hover_bg)
+        elif index.row() % 2:
+            painter.fillRect(rect, self._alt_bg)
+        painter.fillRect(rect.left(), rect.bottom(), rect.width(), 1, self._divider)
+
+
+class ProgressBarDelegate(RowDelegate):
     """Custom delegate for progress bar in table with gradient fill"""
     
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont("Segoe UI", 10)
+        self._font.setWeight(QFont.DemiBold)
+        self._text_width = QFontMetrics(self._font).horizontalAdvance("100%")
+    
+    def refresh_theme(self):
+        """Rebuild the cached colors from the current theme"""
+        super().refresh_theme()
+        t = theme.current
+        self._text_color = QColor(t['text_secondary'])
+        self._track_color = QColor(t['progress_bg'])
+        self._grad_start = QColor(t['accent_gradient_start'])
+        self._grad_end = QColor(t['accent_gradient_end'])
+    
     def paint(self, painter, option, index):
         progress = index.data(Qt.UserRole + 1)
         if progress is None:
             progress = 0
-            
-        t = theme.current
         
+        self.paint_row_background(painter, option, index)
         painter.save()
         painter.setRenderHint(QPainter.Antialiasing)
         
@@ -33,11 +114,9 @@ class ProgressBarDelegate(QStyledItemDelegate):
         
         # Text (Percentage)
         text = f"{int(progress)}%"
-        text_font = QFont("Segoe UI", 10)
-        text_font.setWeight(QFont.DemiBold)
-        painter.setFont(text_font)
+        painter.setFont(self._font)
         
-        text_width = painter.fontMetrics().horizontalAdvance("100%")
+        text_width = self._text_width
         text_rect = QRect(
             rect.right() - text_width - margin_h,
             rect.top(),
@@ -46,7 +125,7 @@ class ProgressBarDelegate(QStyledItemDelegate):
         )
         
         # Draw Text
-        painter.setPen(QColor(t['text_secondary']))
+        painter.setPen(self._text_color)
         painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignRight, text)
         
         # Bar Area
@@ -62,7 +141,7 @@ class ProgressBarDelegate(QStyledItemDelegate):
         )
         
         # Background Track
-        painter.setBrush(QColor(t['progress_bg']))
+        painter.setBrush(self._track_color)
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(bar_rect, 4, 4)
         
@@ -74,8 +153,8 @@ class ProgressBarDelegate(QStyledItemDelegate):
             
             # Gradient
             gradient = QLinearGradient(fill_rect.topLeft(), fill_rect.topRight())
-            gradient.setColorAt(0, QColor(t['accent_gradient_start']))
-            gradient.setColorAt(1, QColor(t['accent_gradient_end']))
+            gradient.setColorAt(0, self._grad_start)
+            gradient.setColorAt(1, self._grad_end)
             
             painter.setBrush(QBrush(gradient))
             painter.drawRoundedRect(fill_rect, 4, 4)
@@ -86,7 +165,7 @@ class ProgressBarDelegate(QStyledItemDelegate):
         return QSize(option.rect.width(), 60)
 
 
-class StatusDelegate(QStyledItemDelegate):
+class StatusDelegate(RowDelegate):
     """Custom delegate for status column with colored badges"""
     
     STATUS_COLORS = {
@@ -100,16 +179,36 @@ class StatusDelegate(QStyledItemDelegate):
         "Stopped": ("status_paused", IconType.STOP),
     }
     
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont("Segoe UI", 7) # Reduced size as requested
+        self._font.setWeight(QFont.Bold)
+        self._font.setLetterSpacing(QFont.AbsoluteSpacing, 0.5)
+    
+    def refresh_theme(self):
+        """Rebuild the row colors and per-status badge styles from the current theme"""
+        super().refresh_theme()
+        self._styles = {status: self._badge_style(status) for status in self.STATUS_COLORS}
+    
+    def _badge_style(self, status):
+        """(text color, background brush, label) for a status badge"""
+        color_key = self.STATUS_COLORS.get(status, ("status_queued", IconType.QUEUE))[0]
+        color = QColor(theme.current[color_key])
+        bg_color = QColor(color)
+        bg_color.setAlpha(25) # More transparent
+        return color, QBrush(bg_color), status.upper()
+    
     def paint(self, painter, option, index):
         status = index.data(Qt.DisplayRole)
         if not status:
             return
-            
-        t = theme.current
-        config = self.STATUS_COLORS.get(status, ("status_queued", IconType.QUEUE))
-        color_key, icon_type = config
-        color = QColor(t[color_key])
         
+        style = self._styles.get(status)
+        if style is None:
+            style = self._styles[status] = self._badge_style(status)
+        color, brush, label = style
+        
+        self.paint_row_background(painter, option, index)
         painter.save()
         painter.setRenderHint(QPainter.Antialiasing)
         
@@ -121,20 +220,15 @@ class StatusDelegate(QStyledItemDelegate):
         badge_rect = QRect(x, y, badge_width, badge_height)
         
         # Background
-        bg_color = QColor(color)
-        bg_color.setAlpha(25) # More transparent
-        painter.setBrush(QBrush(bg_color))
+        painter.setBrush(brush)
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(badge_rect, 6, 6) # Softer radius
         
         # Text (Centered, No Icon)
         painter.setPen(color)
-        font = QFont("Segoe UI", 7) # Reduced size as requested
-        font.setWeight(QFont.Bold)
-        font.setLetterSpacing(QFont.AbsoluteSpacing, 0.5)
-        painter.setFont(font)
+        painter.setFont(self._font)
         
-        painter.drawText(badge_rect, Qt.AlignCenter, status.upper())
+        painter.drawText(badge_rect, Qt.AlignCenter, label)
         
         painter.restore()
         
@@ -142,24 +236,31 @@ class StatusDelegate(QStyledItemDelegate):
         return QSize(110, 60)
 
 
-class FileNameDelegate(QStyledItemDelegate):
+class FileNameDelegate(RowDelegate):
     """Custom delegate for file name with icon"""
     
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont("Segoe UI", 11) # Slightly cleaner font size
+        self._font.setWeight(QFont.DemiBold) # Clearer text
+        self._metrics = QFontMetrics(self._font)
+    
+    def refresh_theme(self):
+        """Rebuild the cached colors from the current theme"""
+        super().refresh_theme()
+        t = theme.current
+        self._text_color = QColor(t['text_primary'])
+        self._active_icon = t['accent_primary']
+        self._idle_icon = t['text_secondary']
+    
     def paint(self, painter, option, index):
         text = index.data(Qt.DisplayRole)
         task = index.data(Qt.UserRole)
         
-        t = theme.current
-        
+        self.paint_row_background(painter, option, index)
         painter.save()
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Selection/hover background
-        if option.state & QStyle.State_Selected:
-            painter.fillRect(option.rect, QColor(t['bg_selected']))
-        elif option.state & QStyle.State_MouseOver:
-            painter.fillRect(option.rect, QColor(t['bg_hover']))
-        
         # Determine icon type based on status
         icon_type = IconType.FILE
         if task:
@@ -176,7 +277,7 @@ class FileNameDelegate(QStyledItemDelegate):
         icon_x = option.rect.left() + 16
         icon_y = option.rect.center().y() - icon_size // 2
         
-        icon_color = t['accent_primary'] if task and task.status == "Downloading" else t['text_secondary']
+        icon_color = self._active_icon if task and task.status == "Downloading" else self._idle_icon
         icon_pixmap = get_pixmap(icon_type, icon_color, icon_size)
         painter.drawPixmap(icon_x, icon_y, icon_pixmap)
         
@@ -185,14 +286,11 @@ class FileNameDelegate(QStyledItemDelegate):
         text_rect = QRect(text_x, option.rect.top(),
                           option.rect.width() - text_x - 10, option.rect.height())
         
-        painter.setPen(QColor(t['text_primary']))
-        font = QFont("Segoe UI", 11) # Slightly cleaner font size
-        font.setWeight(QFont.DemiBold) # Clearer text
-        painter.setFont(font)
+        painter.setPen(self._text_color)
+        painter.setFont(self._font)
         
         # Elide text if too long
-        metrics = painter.fontMetrics()
-        elided_text = metrics.elidedText(text or "", Qt.ElideMiddle, text_rect.width())
+        elided_text = self._metrics.elidedText(text or "", Qt.ElideMiddle, text_rect.width())
         painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, elided_text)
         
         painter.restore()
@@ -201,12 +299,35 @@ class FileNameDelegate(QStyledItemDelegate):
         return QSize(option.rect.width(), 52)
 
 
+class CellFontDelegate(RowDelegate):
+    """Plain text cells drawn in the table's shared body font"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont("Segoe UI", 11)
+        self._metrics = QFontMetrics(self._font)
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.font = self._font
+        option.fontMetrics = self._metrics
+    
+    def paint(self, painter, option, index):
+        self.paint_row_background(painter, option, index)
+        # The row background is done; let the style draw only the text
+        option = QStyleOptionViewItem(option)
+        option.state &= ~(QStyle.State_Selected | QStyle.State_MouseOver)
+        super().paint(painter, option, index)
+
+
 class DownloadList(QWidget):
     """Download list with table and empty state"""
     
     open_progress = Signal(object)
     context_menu_requested = Signal(object, object)
     delete_requested = Signal()
+    
+    FLUSH_INTERVAL = 100  # ms between batched progress repaints
 
     def __init__(self):
         super().__init__()
@@ -215,6 +336,23 @@ class DownloadList(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         
+        self._applied_theme_version = None
+        
+        # Row index per task, keyed by id(task) so signal handlers skip a table scan
+        self._task_row = {}
+        # Signal slots per task, kept so remove_task can disconnect exactly them
+        self._task_slots = {}
+        
+        # Progress ticks are collected here and applied together, one
+        # repaint per flush instead of one per tick per download
+        self._pending = {}
+        # Last (progress, speed, eta, size) queued per task; repeats are dropped
+        self._last_update = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self._flush_updates)
+        
         # Stacked widget for table/empty state
         self.stack = QStackedWidget()
         layout.addWidget(self.stack)
@@ -249,7 +387,9 @@ class DownloadList(QWidget):
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
         self.table.setShowGrid(False)
-        self.table.setAlternatingRowColors(True)
+        # Row tint, selection and hover are painted by the delegates
+        self.table.setAlternatingRowColors(False)
+        self.table.viewport().setAttribute(Qt.WA_Hover)
         self.table.setFocusPolicy(Qt.StrongFocus)
         
         # Column sizing
@@ -273,6 +413,9 @@ class DownloadList(QWidget):
         self.table.setItemDelegateForColumn(0, FileNameDelegate(self.table))
         self.table.setItemDelegateForColumn(2, ProgressBarDelegate(self.table))
         self.table.setItemDelegateForColumn(3, StatusDelegate(self.table))
+        cell_delegate = CellFontDelegate(self.table)
+        for column in (1, 4, 5, 6):
+            self.table.setItemDelegateForColumn(column, cell_delegate)
         
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self._on_context_menu)
@@ -291,77 +434,64 @@ class DownloadList(QWidget):
         
     def _update_empty_state(self):
         """Show empty state if no downloads"""
-        if self.table.rowCount() == 0:
-            self.stack.setCurrentWidget(self.empty_state)
-        else:
-            self.stack.setCurrentWidget(self.table)
+        page = self.table if self._task_row else self.empty_state
+        if self.stack.currentWidget() is not page:
+            self.stack.setCurrentWidget(page)
         
     def apply_theme(self):
+        if self._applied_theme_version == theme.version:
+            return
         t = theme.current
         
-        self.setStyleSheet(f"background-color: {t['bg_primary']};")
-        
-        self.table.setStyleSheet(f"""
-            QTableWidget {{
-                background-color: {t['bg_primary']};
-                alternate-background-color: {t['bg_secondary']};
-                border: none;
-                font-family: 'Segoe UI';
-                font-size: 13px;
-                color: {t['text_primary']};
-                gridline-color: transparent;
-                outline: none;
-            }}
-            
-            QTableWidget::item {{
-                padding: 0px 8px;
-                border: none;
-                border-bottom: 1px solid {t['border_light']};
-            }}
-            
-            QTableWidget::item:selected {{
-                background-color: {t['bg_selected']};
-                color: {t['text_primary']};
-            }}
-            
-            QTableWidget::item:hover {{
-                background-color: {t['bg_hover']};
-            }}
-            
-            QHeaderView::section {{
-                background-color: {t['bg_primary']};
-                color: {t['text_secondary']};
-                padding: 14px 12px;
-                border: none;
-                border-bottom: 1px solid {t['border_primary']};
-                font-weight: 600;
-                font-size: 11px;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }}
-            
-            QHeaderView::section:hover {{
-                background-color: {t['bg_hover']};
-                color: {t['text_secondary']};
-            }}
-            
-            QHeaderView::section:first {{
-                padding-left: 20px;
-            }}
-        """)
+        # Re-setting an identical sheet still re-polishes every child, so skip it
+        bg_qss = f"background-color: {t['bg_primary']};"
+        if self.styleSheet() != bg_qss:
+            self.setStyleSheet(bg_qss)
+        
+        qss = theme.compiled_stylesheet(_build_table_styles)
+        if self.table.styleSheet() != qss:
+            self.table.setStyleSheet(qss)
+        
+        for column in (0, 1, 2, 3):
+            self.table.itemDelegateForColumn(column).refresh_theme()
         
         self.empty_state.apply_theme()
+        self._applied_theme_version = theme.version
 
     def add_task(self, task):
         row = self.table.rowCount()
         self.table.insertRow(row)
+        self._populate_row(row, task)
+        self._update_empty_state()
+
+    def add_tasks(self, tasks):
+        """Add many tasks with one layout pass instead of one per row"""
+        tasks = list(tasks)
+        if not tasks:
+            return
+        
+        first = self.table.rowCount()
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            self.table.setRowCount(first + len(tasks))
+            for offset, task in enumerate(tasks):
+                self._populate_row(first + offset, task)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+        
+        self._update_empty_state()
+
+    def _populate_row(self, row, task):
+        """Fill an already inserted row with the task's items and hook its signals"""
+        self._task_row[id(task)] = row
         self.table.setRowHeight(row, 64)
         
         t = theme.current
         
         # 0: Name (get from save_path, not URL)
-        import os
-        name = os.path.basename(task.save_path) if task.save_path else "Unknown"
+        name = task.save_name if task.save_path else "Unknown"
         name_item = QTableWidgetItem(name)
         name_item.setData(Qt.UserRole, task)
         self.table.setItem(row, 0, name_item)
@@ -370,7 +500,7 @@ class DownloadList(QWidget):
         size_text = format_bytes(task.file_size) if task.file_size > 0 else "-"
         size_item = QTableWidgetItem(size_text)
         size_item.setTextAlignment(Qt.AlignCenter)
-        size_item.setFont(QFont("Segoe UI", 11))
+        size_item.setData(Qt.UserRole, task.file_size)
         self.table.setItem(row, 1, size_item)
         
         # 2: Progress
@@ -390,46 +520,86 @@ class DownloadList(QWidget):
         # 4: Speed
         speed_item = QTableWidgetItem("-")
         speed_item.setTextAlignment(Qt.AlignCenter)
-        speed_item.setFont(QFont("Segoe UI", 11))
         self.table.setItem(row, 4, speed_item)
         
         # 5: ETA
         eta_item = QTableWidgetItem("-")
         eta_item.setTextAlignment(Qt.AlignCenter)
-        eta_item.setFont(QFont("Segoe UI", 11))
         eta_item.setForeground(QColor(t['text_muted']))
         self.table.setItem(row, 5, eta_item)
         
         # 6: Date
-        from datetime import datetime
         added_dt = datetime.fromtimestamp(task.added_time)
         date_item = QTableWidgetItem(added_dt.strftime("%H:%M"))
         date_item.setTextAlignment(Qt.AlignCenter)
-        date_item.setFont(QFont("Segoe UI", 11))
         date_item.setForeground(QColor(t['text_muted']))
         self.table.setItem(row, 6, date_item)
         
-        # Connect signals
-        task.progress_updated.connect(partial(self.update_task_row, task))
-        task.status_changed.connect(partial(self.update_task_status, task))
-        
-        self._update_empty_state()
+        # Connect signals through a weak reference so removed tasks can be freed
+        ref = weakref.ref(task)
+        slots = (partial(self._on_task_progress, ref), partial(self._on_task_status, ref))
+        task.progress_updated.connect(slots[0])
+        task.status_changed.connect(slots[1])
+        self._task_slots[id(task)] = slots
+
+    def _on_task_progress(self, ref, progress, speed, eta):
+        task = ref()
+        if task is not None:
+            self.update_task_row(task, progress, speed, eta)
+
+    def _on_task_status(self, ref, status):
+        task = ref()
+        if task is not None:
+            self.update_task_status(task, status)
 
     def find_row_for_task(self, task):
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.data(Qt.UserRole) == task:
-                return row
-        return -1
+        return self._task_row.get(id(task), -1)
 
     def update_task_row(self, task, progress, speed, eta):
+        sig = (progress, int(speed), int(eta), task.file_size)
+        if self._last_update.get(id(task)) == sig:
+            return
+        self._last_update[id(task)] = sig
+        self._pending[id(task)] = (task, progress, speed, eta)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_updates(self):
+        """Apply the latest progress of every task that ticked since the last flush"""
+        pending, self._pending = self._pending, {}
+        
+        # Each item setter would emit its own dataChanged; silence them and
+        # announce each run of touched rows once instead
+        model = self.table.model()
+        rows = []
+        model.blockSignals(True)
+        try:
+            for task, progress, speed, eta in pending.values():
+                row = self._apply_progress(task, progress, speed, eta)
+                if row != -1:
+                    rows.append(row)
+        finally:
+            model.blockSignals(False)
+        
+        # One range per run of adjacent rows, so untouched rows in between
+        # are not repainted; the view clips each range to what is on screen
+        rows.sort()
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i] != rows[i - 1] + 1:
+                model.dataChanged.emit(model.index(rows[start], 1), model.index(rows[i - 1], 5))
+                start = i
+
+    def _apply_progress(self, task, progress, speed, eta):
         row = self.find_row_for_task(task)
         if row == -1:
-            return
+            return row
         
-        # Size
-        size_text = format_bytes(task.file_size) if task.file_size > 0 else "-"
-        self.table.item(row, 1).setText(size_text)
+        # Size, reformatted only once the server reports it
+        size_item = self.table.item(row, 1)
+        if size_item.data(Qt.UserRole) != task.file_size:
+            size_item.setData(Qt.UserRole, task.file_size)
+            size_item.setText(format_bytes(task.file_size) if task.file_size > 0 else "-")
         
         # Progress
         self.table.item(row, 2).setData(Qt.UserRole + 1, progress)
@@ -445,9 +615,7 @@ class DownloadList(QWidget):
         
         # ETA
         self.table.item(row, 5).setText(format_time(eta) if eta > 0 else "-")
-        
-        # Refresh view
-        self.table.viewport().update()
+        return row
 
     def update_task_status(self, task, status):
         row = self.find_row_for_task(task)
@@ -457,8 +625,9 @@ class DownloadList(QWidget):
         display_status = "Completed" if status == "Finished" else status
         self.table.item(row, 3).setText(display_status)
         
-        # Refresh file name column to update icon
-        self.table.viewport().update()
+        # Refresh file name column to update icon; the status cell
+        # repaints itself through setText
+        self.table.viewport().update(self.table.visualRect(self.table.model().index(row, 0)))
 
     def _on_double_click(self, item):
         row = item.row()
@@ -468,9 +637,22 @@ class DownloadList(QWidget):
             self.open_progress.emit(task)
 
     def remove_task(self, task):
-        row = self.find_row_for_task(task)
+        self._pending.pop(id(task), None)
+        self._last_update.pop(id(task), None)
+        slots = self._task_slots.pop(id(task), None)
+        if slots:
+            try:
+                task.progress_updated.disconnect(slots[0])
+                task.status_changed.disconnect(slots[1])
+            except (RuntimeError, TypeError):
+                pass
+        row = self._task_row.pop(id(task), -1)
         if row != -1:
             self.table.removeRow(row)
+            self._task_row = {
+                key: r - 1 if r > row else r
+                for key, r in self._task_row.items()
+            }
         self._update_empty_state()
 
     def _on_context_menu(self, pos):
@@ -485,7 +667,8 @@ class DownloadList(QWidget):
     
     # Delegate methods to table
     def rowCount(self):
-        return self.table.rowCount()
+        # One entry per row, already kept in step by add/remove
+        return len(self._task_row)
     
     def selectedItems(self):
         return self.table.selectedItems()
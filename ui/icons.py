@@ -1,8 +1,20 @@
-from PySide6.QtCore import Qt, QRect, QRectF, QPointF, QSize
+from PySide6.QtCore import Qt, QRect, QRectF, QPointF, QLineF, QSize
 from PySide6.QtGui import (QIcon, QPixmap, QPainter, QPen, QColor, QBrush,
-                            QPainterPath, QLinearGradient, QFont)
+                            QPainterPath, QLinearGradient, QFont, QPixmapCache,
+                            QTransform)
 from PySide6.QtWidgets import QApplication
 from enum import Enum, auto
+from functools import lru_cache
+import math
+
+_sin, _cos, _pi = math.sin, math.cos, math.pi
+
+# Unit (cos, sin) of the sun icon's eight ray angles, 45 degrees apart
+_SUN_RAY_DIRECTIONS = tuple((_cos(i * _pi / 4), _sin(i * _pi / 4)) for i in range(8))
+
+
+# Room for a few hundred rendered icons at 2x; least recently used ones are evicted
+QPixmapCache.setCacheLimit(20480)
 
 
 class IconType(Enum):
@@ -44,13 +56,109 @@ class IconType(Enum):
     COPY = auto()
 
 
+# ═══════════════════════════════════════════════════════════════
+#                     SHARED COLOURS AND PENS
+# ═══════════════════════════════════════════════════════════════
+# Icons are redrawn in a handful of theme colours, so the parsed colour,
+# its fill brush and the stroke pen are built once per colour string
+
+@lru_cache(maxsize=64)
+def _color(color: str) -> QColor:
+    return QColor(color)
+
+
+@lru_cache(maxsize=64)
+def _brush(color: str) -> QBrush:
+    return QBrush(_color(color))
+
+
+@lru_cache(maxsize=64)
+def _pen(color: str, width: float) -> QPen:
+    pen = QPen(_color(color))
+    pen.setWidthF(width)
+    pen.setCapStyle(Qt.RoundCap)
+    pen.setJoinStyle(Qt.RoundJoin)
+    return pen
+
+
+@lru_cache(maxsize=16)
+def _blank(actual_size: int, device_pixel_ratio: float) -> QPixmap:
+    """Transparent pixmap that new icons start from instead of clearing their own"""
+    pixmap = QPixmap(actual_size, actual_size)
+    if device_pixel_ratio != 1.0:
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.transparent)
+    return pixmap
+
+
+# ═══════════════════════════════════════════════════════════════
+#                        PATH TEMPLATES
+# ═══════════════════════════════════════════════════════════════
+# Shapes that only differ by position and size between renders are built
+# once around the origin, then mapped into place per icon
+
+@lru_cache(maxsize=1)
+def _gear_template() -> QPainterPath:
+    """Eight-tooth gear outline, outer radius 1, inner radius 0.625"""
+    inner_r = 0.625
+    teeth = 8
+    step = 2 * _pi / teeth
+    half_pi = _pi / 2
+    
+    path = QPainterPath()
+    for i in range(teeth):
+        angle1 = i * step - half_pi
+        angle2 = (i + 0.4) * step - half_pi
+        angle3 = (i + 0.6) * step - half_pi
+        angle4 = (i + 1) * step - half_pi
+        
+        if i == 0:
+            path.moveTo(_cos(angle1), _sin(angle1))
+        
+        path.lineTo(_cos(angle2), _sin(angle2))
+        path.lineTo(inner_r * _cos(angle3), inner_r * _sin(angle3))
+        path.lineTo(inner_r * _cos(angle4), inner_r * _sin(angle4))
+    
+    path.closeSubpath()
+    return path
+
+
+# Path boolean ops flatten curves with an absolute tolerance, so a crescent
+# cut at one radius does not scale cleanly; it is cached per radius instead
+@lru_cache(maxsize=32)
+def _crescent_template(r: float) -> QPainterPath:
+    """Moon crescent around the origin: a disc with an offset disc cut out"""
+    path = QPainterPath()
+    path.addEllipse(QPointF(0, 0), r, r)
+    cut_path = QPainterPath()
+    cut_path.addEllipse(QPointF(r * 0.6, -r * 0.3), r * 0.8, r * 0.8)
+    return path.subtracted(cut_path)
+
+
+def _placed(template: QPainterPath, cx: float, cy: float,
+            scale: float = 1.0) -> QPainterPath:
+    """Map a template built around the origin to a center point and scale"""
+    transform = QTransform()
+    transform.translate(cx, cy)
+    transform.scale(scale, scale)
+    return transform.map(template)
+
+
 class IconProvider:
     """
     Professional vector icon provider using QPainter.
     Creates crisp, scalable icons at any size.
     """
     
+    # QIcon wrappers only; the rendered pixmaps live in Qt's bounded QPixmapCache
     _cache = {}
+    # Primary screen pixel ratio, resolved on first use and reset when screens change
+    _dpr = None
+    _screens_hooked = False
+    # IconType -> drawing method; filled in below the class body
+    _DRAW_METHODS = {}
+    # The same methods indexed by IconType.value, placeholder where unmapped
+    _DRAW_TABLE = ()
     
     @classmethod
     def get_icon(cls, icon_type: IconType, color: str = "#FFFFFF", 
@@ -75,34 +183,130 @@ class IconProvider:
     def clear_cache(cls):
         """Clear the icon cache (call when theme changes)"""
         cls._cache.clear()
+        QPixmapCache.clear()
     
     @classmethod
-    def _create_pixmap(cls, icon_type: IconType, color: str, size: int) -> QPixmap:
-        """Create a pixmap with the drawn icon"""
-        # High DPI support
-        device_pixel_ratio = 2.0
-        if QApplication.instance():
-            screen = QApplication.primaryScreen()
-            if screen:
-                device_pixel_ratio = screen.devicePixelRatio()
-        
+    def _resolve_dpr(cls) -> float:
+        """Look up the primary screen's device pixel ratio and remember it"""
+        app = QApplication.instance()
+        screen = app.primaryScreen() if app else None
+        if screen is None:
+            # No display to match yet; don't pay for a HiDPI buffer
+            return 1.0
+        if not cls._screens_hooked:
+            app.primaryScreenChanged.connect(cls._reset_dpr)
+            app.screenAdded.connect(cls._reset_dpr)
+            cls._screens_hooked = True
+        cls._dpr = screen.devicePixelRatio()
+        return cls._dpr
+    
+    @classmethod
+    def _reset_dpr(cls, *_):
+        # Cached QIcons were rendered for the old ratio; pixmap cache keys include it
+        cls._dpr = None
+        cls._cache.clear()
+    
+    @classmethod
+    def build_atlas(cls, color: str = "#FFFFFF", size: int = 24):
+        """
+        Render every icon type for one colour and size in a single paint pass.
+        The strip is sliced into the pixmap cache, so later lookups are hits.
+        """
+        device_pixel_ratio = cls._dpr or cls._resolve_dpr()
         actual_size = int(size * device_pixel_ratio)
-        pixmap = QPixmap(actual_size, actual_size)
-        pixmap.setDevicePixelRatio(device_pixel_ratio)
-        pixmap.fill(Qt.transparent)
+        icon_types = list(IconType)
+        
+        atlas = QPixmap(actual_size * len(icon_types), actual_size)
+        if device_pixel_ratio != 1.0:
+            atlas.setDevicePixelRatio(device_pixel_ratio)
+        atlas.fill(Qt.transparent)
         
+        painter, pen_width = cls._begin(atlas, color, size)
+        rect = QRectF(pen_width, pen_width, 
+                      size - 2 * pen_width, size - 2 * pen_width)
+        # Slots are whole device pixels wide so each one rasterises exactly
+        # like a standalone pixmap
+        slot = QRectF(0, 0, actual_size / device_pixel_ratio,
+                      actual_size / device_pixel_ratio)
+        for index in range(len(icon_types)):
+            painter.save()
+            painter.translate(index * slot.width(), 0)
+            painter.setClipRect(slot)
+            cls._draw_icon(painter, icon_types[index], rect, color, pen_width)
+            painter.restore()
+        painter.end()
+        
+        opaque = _color(color).alpha() == 255
+        for index, icon_type in enumerate(icon_types):
+            pixmap = atlas.copy(index * actual_size, 0, actual_size, actual_size)
+            cls._store(icon_type, color, size, device_pixel_ratio, pixmap, opaque)
+    
+    @classmethod
+    def _create_pixmap(cls, icon_type: IconType, color: str, size: int) -> QPixmap:
+        """Create a pixmap with the drawn icon, or reuse the cached rendering"""
+        # High DPI support
+        device_pixel_ratio = cls._dpr or cls._resolve_dpr()
+        
+        pixmap = QPixmapCache.find(
+            cls._pixmap_key(icon_type, color, size, device_pixel_ratio))
+        if pixmap is not None:
+            return pixmap
+        
+        # Every icon is drawn in a single colour, so any opaque rendering of the
+        # same shape can be recoloured instead of replaying the painter calls
+        qcolor = _color(color)
+        opaque = qcolor.alpha() == 255
+        shape = (QPixmapCache.find(cls._shape_key(icon_type, size, device_pixel_ratio))
+                 if opaque else None)
+        
+        if shape is not None:
+            pixmap = cls._recolor(shape, qcolor, size)
+        else:
+            pixmap = cls._render(icon_type, color, size, device_pixel_ratio)
+        cls._store(icon_type, color, size, device_pixel_ratio, pixmap,
+                   opaque and shape is None)
+        return pixmap
+    
+    @staticmethod
+    def _pixmap_key(icon_type: IconType, color: str, size: int,
+                    device_pixel_ratio: float) -> str:
+        return f"hdm:{icon_type.value}:{color}:{size}:{device_pixel_ratio}"
+    
+    @staticmethod
+    def _shape_key(icon_type: IconType, size: int, device_pixel_ratio: float) -> str:
+        return f"hdm-shape:{icon_type.value}:{size}:{device_pixel_ratio}"
+    
+    @classmethod
+    def _store(cls, icon_type: IconType, color: str, size: int,
+               device_pixel_ratio: float, pixmap: QPixmap, as_shape: bool):
+        """Cache a rendering, optionally also as the icon's recolourable shape"""
+        QPixmapCache.insert(
+            cls._pixmap_key(icon_type, color, size, device_pixel_ratio), pixmap)
+        if as_shape:
+            QPixmapCache.insert(
+                cls._shape_key(icon_type, size, device_pixel_ratio), pixmap)
+    
+    @staticmethod
+    def _begin(pixmap: QPixmap, color: str, size: int):
+        """Open a painter on pixmap with the icon pen; returns (painter, pen width)"""
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.setRenderHint(QPainter.SmoothPixmapTransform)
         
         # Setup pen
         pen_width = max(1.5, size / 12)
-        pen = QPen(QColor(color))
-        pen.setWidthF(pen_width)
-        pen.setCapStyle(Qt.RoundCap)
-        pen.setJoinStyle(Qt.RoundJoin)
-        painter.setPen(pen)
+        painter.setPen(_pen(color, pen_width))
         painter.setBrush(Qt.NoBrush)
+        return painter, pen_width
+    
+    @classmethod
+    def _render(cls, icon_type: IconType, color: str, size: int,
+                device_pixel_ratio: float) -> QPixmap:
+        """Draw the icon from scratch"""
+        # Copy-on-write share of a cleared pixmap; the painter detaches it
+        pixmap = QPixmap(_blank(int(size * device_pixel_ratio), device_pixel_ratio))
+        
+        painter, pen_width = cls._begin(pixmap, color, size)
         
         # Draw the icon
         rect = QRectF(pen_width, pen_width, 
@@ -112,51 +316,25 @@ class IconProvider:
         painter.end()
         return pixmap
     
+    @staticmethod
+    def _recolor(shape: QPixmap, color: QColor, size: int) -> QPixmap:
+        """Copy an opaque rendering of an icon, keeping its coverage but not its colour"""
+        pixmap = shape.copy()
+        
+        painter = QPainter(pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        painter.fillRect(QRectF(0, 0, size, size), color)
+        painter.end()
+        return pixmap
+    
     @classmethod
     def _draw_icon(cls, painter: QPainter, icon_type: IconType, 
                    rect: QRectF, color: str, stroke: float):
-        """Draw the specific icon type"""
-        
-        method_map = {
-            IconType.ADD: cls._draw_add,
-            IconType.DOWNLOAD: cls._draw_download,
-            IconType.PAUSE: cls._draw_pause,
-            IconType.RESUME: cls._draw_resume,
-            IconType.STOP: cls._draw_stop,
-            IconType.DELETE: cls._draw_delete,
-            IconType.FOLDER: cls._draw_folder,
-            IconType.FILE: cls._draw_file,
-            IconType.SETTINGS: cls._draw_settings,
-            IconType.THEME_DARK: cls._draw_moon,
-            IconType.THEME_LIGHT: cls._draw_sun,
-            IconType.REFRESH: cls._draw_refresh,
-            IconType.LINK: cls._draw_link,
-            IconType.CHECK: cls._draw_check,
-            IconType.CLOSE: cls._draw_close,
-            IconType.CLOCK: cls._draw_clock,
-            IconType.SPEED: cls._draw_speed,
-            IconType.STORAGE: cls._draw_storage,
-            IconType.QUEUE: cls._draw_queue,
-            IconType.COMPLETE: cls._draw_complete,
-            IconType.WARNING: cls._draw_warning,
-            IconType.ERROR: cls._draw_error,
-            IconType.INFO: cls._draw_info,
-            IconType.SEARCH: cls._draw_search,
-            IconType.MENU: cls._draw_menu,
-            IconType.ARROW_DOWN: cls._draw_arrow_down,
-            IconType.ARROW_RIGHT: cls._draw_arrow_right,
-            IconType.ARROW_UP: cls._draw_arrow_up,
-            IconType.GLOBE: cls._draw_globe,
-            IconType.MINIMIZE: cls._draw_minimize,
-            IconType.MAXIMIZE: cls._draw_maximize,
-            IconType.CHROME: cls._draw_chrome,
-            IconType.FIREFOX: cls._draw_firefox,
-            IconType.EDGE: cls._draw_edge,
-            IconType.COPY: cls._draw_copy,
-        }
-        
-        draw_method = method_map.get(icon_type, cls._draw_placeholder)
-        draw_method(painter, rect, color, stroke)
+        """
+        Draw the specific icon type. Filled shapes are drawn last, and the brush
+        is left set: the painter is ended or restored after every icon.
+        """
+        cls._DRAW_TABLE[icon_type.value](painter, rect, color, stroke)
         
     @staticmethod
     def _draw_copy(painter: QPainter, rect: QRectF, color: str, stroke: float):
@@ -226,10 +404,9 @@ class IconProvider:
         
         cx = rect.center().x()
         
-        # Left bar
-        painter.drawLine(QPointF(cx - gap, top), QPointF(cx - gap, bottom))
-        # Right bar  
-        painter.drawLine(QPointF(cx + gap, top), QPointF(cx + gap, bottom))
+        # Left and right bars
+        painter.drawLines([QLineF(cx - gap, top, cx - gap, bottom),
+                           QLineF(cx + gap, top, cx + gap, bottom)])
     
     @staticmethod
     def _draw_resume(painter: QPainter, rect: QRectF, color: str, stroke: float):
@@ -247,9 +424,8 @@ class IconProvider:
         path.lineTo(left, bottom)
         path.closeSubpath()
         
-        painter.setBrush(QBrush(QColor(color)))
+        painter.setBrush(_brush(color))
         painter.drawPath(path)
-        painter.setBrush(Qt.NoBrush)
     
     @staticmethod
     def _draw_stop(painter: QPainter, rect: QRectF, color: str, stroke: float):
@@ -257,9 +433,8 @@ class IconProvider:
         margin = rect.width() * 0.25
         stop_rect = rect.adjusted(margin, margin, -margin, -margin)
         
-        painter.setBrush(QBrush(QColor(color)))
+        painter.setBrush(_brush(color))
         painter.drawRoundedRect(stop_rect, 2, 2)
-        painter.setBrush(Qt.NoBrush)
     
     @staticmethod
     def _draw_delete(painter: QPainter, rect: QRectF, color: str, stroke: float):
@@ -268,18 +443,17 @@ class IconProvider:
         lid_y = rect.top() + rect.height() * 0.2
         lid_left = rect.left() + rect.width() * 0.15
         lid_right = rect.right() - rect.width() * 0.15
-        painter.drawLine(QPointF(lid_left, lid_y), QPointF(lid_right, lid_y))
         
         # Handle
         handle_width = rect.width() * 0.2
         cx = rect.center().x()
         handle_top = rect.top() + rect.height() * 0.08
-        painter.drawLine(QPointF(cx - handle_width, lid_y),
-                        QPointF(cx - handle_width, handle_top))
-        painter.drawLine(QPointF(cx - handle_width, handle_top),
-                        QPointF(cx + handle_width, handle_top))
-        painter.drawLine(QPointF(cx + handle_width, handle_top),
-                        QPointF(cx + handle_width, lid_y))
+        painter.drawLines([
+            QLineF(lid_left, lid_y, lid_right, lid_y),
+            QLineF(cx - handle_width, lid_y, cx - handle_width, handle_top),
+            QLineF(cx - handle_width, handle_top, cx + handle_width, handle_top),
+            QLineF(cx + handle_width, handle_top, cx + handle_width, lid_y),
+        ])
         
         # Body
         body_top = lid_y + rect.height() * 0.05
@@ -354,31 +528,8 @@ class IconProvider:
         """Gear/settings icon"""
         cx, cy = rect.center().x(), rect.center().y()
         outer_r = rect.width() * 0.4
-        inner_r = rect.width() * 0.25
-        teeth = 8
         
-        path = QPainterPath()
-        import math
-        
-        for i in range(teeth):
-            angle1 = (i * 2 * math.pi / teeth) - math.pi / 2
-            angle2 = ((i + 0.4) * 2 * math.pi / teeth) - math.pi / 2
-            angle3 = ((i + 0.6) * 2 * math.pi / teeth) - math.pi / 2
-            angle4 = ((i + 1) * 2 * math.pi / teeth) - math.pi / 2
-            
-            if i == 0:
-                path.moveTo(cx + outer_r * math.cos(angle1),
-                           cy + outer_r * math.sin(angle1))
-            
-            path.lineTo(cx + outer_r * math.cos(angle2),
-                       cy + outer_r * math.sin(angle2))
-            path.lineTo(cx + inner_r * math.cos(angle3),
-                       cy + inner_r * math.sin(angle3))
-            path.lineTo(cx + inner_r * math.cos(angle4),
-                       cy + inner_r * math.sin(angle4))
-        
-        path.closeSubpath()
-        painter.drawPath(path)
+        painter.drawPath(_placed(_gear_template(), cx, cy, outer_r))
         
         # Center circle
         center_r = rect.width() * 0.12
@@ -390,17 +541,8 @@ class IconProvider:
         cx, cy = rect.center().x(), rect.center().y()
         r = rect.width() * 0.35
         
-        path = QPainterPath()
-        path.addEllipse(QPointF(cx, cy), r, r)
-        
-        # Subtract circle for crescent
-        cut_path = QPainterPath()
-        cut_path.addEllipse(QPointF(cx + r * 0.6, cy - r * 0.3), r * 0.8, r * 0.8)
-        
-        result = path.subtracted(cut_path)
-        painter.setBrush(QBrush(QColor(color)))
-        painter.drawPath(result)
-        painter.setBrush(Qt.NoBrush)
+        painter.setBrush(_brush(color))
+        painter.drawPath(_placed(_crescent_template(r), cx, cy))
     
     @staticmethod
     def _draw_sun(painter: QPainter, rect: QRectF, color: str, stroke: float):
@@ -410,20 +552,16 @@ class IconProvider:
         ray_inner = rect.width() * 0.25
         ray_outer = rect.width() * 0.38
         
-        # Center circle
-        painter.setBrush(QBrush(QColor(color)))
+        # Center circle; the rays are lines, which the brush does not affect
+        painter.setBrush(_brush(color))
         painter.drawEllipse(QPointF(cx, cy), r, r)
-        painter.setBrush(Qt.NoBrush)
         
         # Rays
-        import math
-        for i in range(8):
-            angle = i * math.pi / 4
-            x1 = cx + ray_inner * math.cos(angle)
-            y1 = cy + ray_inner * math.sin(angle)
-            x2 = cx + ray_outer * math.cos(angle)
-            y2 = cy + ray_outer * math.sin(angle)
-            painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+        painter.drawLines([
+            QLineF(cx + ray_inner * dx, cy + ray_inner * dy,
+                   cx + ray_outer * dx, cy + ray_outer * dy)
+            for dx, dy in _SUN_RAY_DIRECTIONS
+        ])
     
     @staticmethod
     def _draw_refresh(painter: QPainter, rect: QRectF, color: str, stroke: float):
@@ -432,16 +570,14 @@ class IconProvider:
         r = rect.width() * 0.32
         arrow_size = rect.width() * 0.12
         
-        import math
-        
         # Draw arc
         arc_rect = QRectF(cx - r, cy - r, r * 2, r * 2)
         painter.drawArc(arc_rect, 45 * 16, 270 * 16)
         
         # Arrow at end
-        end_angle = math.radians(45)
-        end_x = cx + r * math.cos(end_angle)
-        end_y = cy - r * math.sin(end_angle)
+        end_angle = _pi / 4
+        end_x = cx + r * _cos(end_angle)
+        end_y = cy - r * _sin(end_angle)
         
         painter.drawLine(QPointF(end_x, end_y),
                         QPointF(end_x + arrow_size, end_y))
@@ -525,9 +661,8 @@ class IconProvider:
         path.lineTo(cx - rect.width() * 0.05, rect.center().y())
         path.closeSubpath()
         
-        painter.setBrush(QBrush(QColor(color)))
+        painter.setBrush(_brush(color))
         painter.drawPath(path)
-        painter.setBrush(Qt.NoBrush)
     
     @staticmethod
     def _draw_storage(painter: QPainter, rect: QRectF, color: str, stroke: float):
@@ -546,10 +681,9 @@ class IconProvider:
         # LED dots
         dot_r = rect.width() * 0.04
         dot_y = storage_rect.bottom() - (storage_rect.height() / 4)
-        painter.setBrush(QBrush(QColor(color)))
+        painter.setBrush(_brush(color))
         painter.drawEllipse(QPointF(storage_rect.right() - rect.width() * 0.15, dot_y),
                            dot_r, dot_r)
-        painter.setBrush(Qt.NoBrush)
     
     @staticmethod
     def _draw_queue(painter: QPainter, rect: QRectF, color: str, stroke: float):
@@ -557,9 +691,11 @@ class IconProvider:
         left = rect.left() + rect.width() * 0.15
         right = rect.right() - rect.width() * 0.15
         
+        lines = []
         for i in range(3):
             y = rect.top() + rect.height() * (0.3 + i * 0.2)
-            painter.drawLine(QPointF(left, y), QPointF(right, y))
+            lines.append(QLineF(left, y, right, y))
+        painter.drawLines(lines)
     
     @staticmethod
     def _draw_complete(painter: QPainter, rect: QRectF, color: str, stroke: float):
@@ -595,10 +731,9 @@ class IconProvider:
         cy = rect.center().y()
         painter.drawLine(QPointF(cx, cy - rect.height() * 0.1),
                         QPointF(cx, cy + rect.height() * 0.08))
-        painter.setBrush(QBrush(QColor(color)))
+        painter.setBrush(_brush(color))
         painter.drawEllipse(QPointF(cx, bottom - rect.height() * 0.12),
                            rect.width() * 0.03, rect.width() * 0.03)
-        painter.setBrush(Qt.NoBrush)
     
     @staticmethod
     def _draw_error(painter: QPainter, rect: QRectF, color: str, stroke: float):
@@ -625,15 +760,14 @@ class IconProvider:
         # Circle
         painter.drawEllipse(QPointF(cx, cy), r, r)
         
-        # i dot
-        painter.setBrush(QBrush(QColor(color)))
-        painter.drawEllipse(QPointF(cx, cy - r * 0.45), 
-                           rect.width() * 0.05, rect.width() * 0.05)
-        painter.setBrush(Qt.NoBrush)
-        
         # i stem
         painter.drawLine(QPointF(cx, cy - r * 0.15),
                         QPointF(cx, cy + r * 0.5))
+        
+        # i dot
+        painter.setBrush(_brush(color))
+        painter.drawEllipse(QPointF(cx, cy - r * 0.45), 
+                           rect.width() * 0.05, rect.width() * 0.05)
     
     @staticmethod
     def _draw_search(painter: QPainter, rect: QRectF, color: str, stroke: float):
@@ -646,9 +780,8 @@ class IconProvider:
         painter.drawEllipse(QPointF(cx, cy), r, r)
         
         # Handle
-        import math
-        handle_start_x = cx + r * math.cos(math.pi / 4)
-        handle_start_y = cy + r * math.sin(math.pi / 4)
+        handle_start_x = cx + r * _cos(_pi / 4)
+        handle_start_y = cy + r * _sin(_pi / 4)
         handle_end_x = rect.right() - rect.width() * 0.18
         handle_end_y = rect.bottom() - rect.height() * 0.18
         
@@ -661,9 +794,11 @@ class IconProvider:
         left = rect.left() + rect.width() * 0.2
         right = rect.right() - rect.width() * 0.2
         
+        lines = []
         for i in range(3):
             y = rect.top() + rect.height() * (0.3 + i * 0.2)
-            painter.drawLine(QPointF(left, y), QPointF(right, y))
+            lines.append(QLineF(left, y, right, y))
+        painter.drawLines(lines)
     
     @staticmethod
     def _draw_arrow_down(painter: QPainter, rect: QRectF, color: str, stroke: float):
@@ -749,7 +884,6 @@ class IconProvider:
         
         painter.drawEllipse(QPointF(cx, cy), r, r)
         # Simplified fox tail
-        import math
         path = QPainterPath()
         path.moveTo(cx + r * 0.5, cy - r * 0.5)
         path.quadTo(cx + r, cy - r * 0.8, cx + r * 0.3, cy - r)
@@ -762,7 +896,6 @@ class IconProvider:
         r = rect.width() * 0.38
         
         # Wave shape
-        import math
         path = QPainterPath()
         path.moveTo(cx - r, cy)
         path.quadTo(cx - r, cy - r, cx, cy - r)
@@ -778,6 +911,51 @@ class IconProvider:
         painter.drawLine(rect.topRight(), rect.bottomLeft())
 
 
+# Drawing method per icon type, built once the drawing methods exist
+IconProvider._DRAW_METHODS = {
+    IconType.ADD: IconProvider._draw_add,
+    IconType.DOWNLOAD: IconProvider._draw_download,
+    IconType.PAUSE: IconProvider._draw_pause,
+    IconType.RESUME: IconProvider._draw_resume,
+    IconType.STOP: IconProvider._draw_stop,
+    IconType.DELETE: IconProvider._draw_delete,
+    IconType.FOLDER: IconProvider._draw_folder,
+    IconType.FILE: IconProvider._draw_file,
+    IconType.SETTINGS: IconProvider._draw_settings,
+    IconType.THEME_DARK: IconProvider._draw_moon,
+    IconType.THEME_LIGHT: IconProvider._draw_sun,
+    IconType.REFRESH: IconProvider._draw_refresh,
+    IconType.LINK: IconProvider._draw_link,
+    IconType.CHECK: IconProvider._draw_check,
+    IconType.CLOSE: IconProvider._draw_close,
+    IconType.CLOCK: IconProvider._draw_clock,
+    IconType.SPEED: IconProvider._draw_speed,
+    IconType.STORAGE: IconProvider._draw_storage,
+    IconType.QUEUE: IconProvider._draw_queue,
+    IconType.COMPLETE: IconProvider._draw_complete,
+    IconType.WARNING: IconProvider._draw_warning,
+    IconType.ERROR: IconProvider._draw_error,
+    IconType.INFO: IconProvider._draw_info,
+    IconType.SEARCH: IconProvider._draw_search,
+    IconType.MENU: IconProvider._draw_menu,
+    IconType.ARROW_DOWN: IconProvider._draw_arrow_down,
+    IconType.ARROW_RIGHT: IconProvider._draw_arrow_right,
+    IconType.ARROW_UP: IconProvider._draw_arrow_up,
+    IconType.GLOBE: IconProvider._draw_globe,
+    IconType.MINIMIZE: IconProvider._draw_minimize,
+    IconType.MAXIMIZE: IconProvider._draw_maximize,
+    IconType.CHROME: IconProvider._draw_chrome,
+    IconType.FIREFOX: IconProvider._draw_firefox,
+    IconType.EDGE: IconProvider._draw_edge,
+    IconType.COPY: IconProvider._draw_copy,
+}
+_draw_table = [IconProvider._draw_placeholder] * (max(t.value for t in IconType) + 1)
+for _icon_type, _method in IconProvider._DRAW_METHODS.items():
+    _draw_table[_icon_type.value] = _method
+IconProvider._DRAW_TABLE = tuple(_draw_table)
+del _draw_table, _icon_type, _method
+
+
 # Convenience functions
 def get_icon(icon_type: IconType, color: str = "#FFFFFF", size: int = 24) -> QIcon:
     """Convenience function to get an icon"""
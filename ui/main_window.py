@@ -28,6 +28,7 @@ class MainWindow(QMainWindow):
         
         self._active_dialogs = []
         self._ytdlp_updater = None
+        self._applied_theme_version = None
         
         # Initialize components
         self.manager = DownloadManager()
@@ -59,8 +60,7 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(5000, self.updater.start)
         
         # Restore downloads
-        for task in self.manager.downloads:
-            self.list_view.add_task(task)
+        self.list_view.add_tasks(self.manager.downloads)
             
         # First run check
         QTimer.singleShot(500, self.check_first_run)
@@ -312,10 +312,15 @@ class MainWindow(QMainWindow):
         
     def apply_theme(self):
         """Apply current theme to all components"""
+        # Restyling the whole window and flushing the icon cache is costly,
+        # so only do it when the theme actually changed
+        if self._applied_theme_version == theme.version:
+            return
         t = theme.current
         
-        # Clear icon cache
+        # Clear icon cache and pre-render the menu icon set in one pass
         IconProvider.clear_cache()
+        IconProvider.build_atlas(t['text_primary'], 16)
         
         # Main stylesheet
         self.setStyleSheet(theme.get_main_stylesheet())
@@ -350,6 +355,7 @@ class MainWindow(QMainWindow):
         
         # Update menu icons
         self._update_menu_icons()
+        self._applied_theme_version = theme.version
         
     def _update_menu_icons(self):
         t = theme.current
@@ -585,8 +591,7 @@ class MainWindow(QMainWindow):
             
     def open_folder(self, task):
         try:
-            folder = os.path.dirname(task.save_path)
-            os.startfile(folder)
+            os.startfile(task.save_dir)
         except Exception as e:
             print(f"Error opening folder: {e}")
             
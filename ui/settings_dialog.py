@@ -311,6 +311,8 @@ class SettingsDialog(BaseDialog):
         self._tester.start()
     
     def apply_theme(self):
+        if self._theme_is_current():
+            return
         super().apply_theme()
         t = theme.current
         
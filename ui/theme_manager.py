@@ -144,6 +144,13 @@ class ThemeManager(QObject):
         "shadow_color_strong": "rgba(0, 0, 0, 0.15)",
     }
 
+    # Accent tints at alpha 30 (#AARRGGBB) for icon badge backgrounds,
+    # so dialogs don't build a QColor for them on every open
+    for _palette in (DARK_THEME, LIGHT_THEME):
+        for _key in ("accent_primary", "accent_success"):
+            _palette[_key + "_a30"] = "#1E" + _palette[_key][1:]
+    del _palette, _key
+
     
     _instance = None
     
@@ -159,6 +166,12 @@ class ThemeManager(QObject):
         super().__init__()
         self._initialized = True
         self._current_theme = self.LIGHT_THEME
+        # Bumped on every theme change so widgets can skip redundant restyles
+        self.version = 0
+        # Stylesheets compiled from palette builders, by (builder, theme name)
+        self._compiled_qss = {}
+        # Builders compiled up front whenever a theme is loaded
+        self._qss_builders = [self._build_dialog_stylesheet]
         
     @property
     def current(self) -> dict:
@@ -176,6 +189,10 @@ class ThemeManager(QObject):
             self._current_theme = self.DARK_THEME
         else:
             self._current_theme = self.LIGHT_THEME
+        self.version += 1
+        # Compile before notifying, so every restyle is a plain lookup
+        for build in self._qss_builders:
+            self.compiled_stylesheet(build)
         self.theme_changed.emit(theme_name)
         
     def toggle_theme(self):
@@ -320,9 +337,28 @@ class ThemeManager(QObject):
             }}
         """
     
+    def register_stylesheet(self, build):
+        """Register a palette -> QSS builder to be compiled on every theme load.
+        Returns the builder, so it can be used as a decorator"""
+        self._qss_builders.append(build)
+        return build
+    
+    def compiled_stylesheet(self, build) -> str:
+        """Get build's stylesheet for the current palette, formatted once per theme"""
+        key = (build, self._current_theme['name'])
+        qss = self._compiled_qss.get(key)
+        if qss is None:
+            # Collapsed to a single line; Qt parses it faster and it is stored once
+            qss = self._compiled_qss[key] = " ".join(build(self._current_theme).split())
+        return qss
+    
     def get_dialog_stylesheet(self) -> str:
+        """Get the dialog stylesheet, built once per theme"""
+        return self.compiled_stylesheet(self._build_dialog_stylesheet)
+    
+    @staticmethod
+    def _build_dialog_stylesheet(t: dict) -> str:
         """Generate dialog stylesheet"""
-        t = self._current_theme
         return f"""
             QDialog {{
                 background-color: {t['bg_primary']};
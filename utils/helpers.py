@@ -2,6 +2,16 @@
 Utility helper functions for formatting and calculations
 """
 import os
+from functools import lru_cache
+
+
+# The formatters are pure and hit with the same values many times a second
+# while downloads are running, so their results are memoized. Sizes and
+# times are cached on the exact value; speeds are cached on the rounded
+# number that is displayed, so nearby speeds share an entry without
+# changing the text
+_SPEED_UNITS = ('B/s', 'KB/s', 'MB/s', 'GB/s')
+
 
 def format_bytes(bytes_value: int, precision: int = 1) -> str:
     """
@@ -14,6 +24,11 @@ def format_bytes(bytes_value: int, precision: int = 1) -> str:
     Returns:
         Formatted string like "1.5 GB"
     """
+    return _format_bytes(bytes_value, precision)
+
+
+@lru_cache(maxsize=4096)
+def _format_bytes(bytes_value: int, precision: int) -> str:
     if bytes_value < 0:
         return "0 B"
     
@@ -45,18 +60,25 @@ def format_speed(bytes_per_second: float, precision: int = 1) -> str:
     if bytes_per_second <= 0:
         return "0 B/s"
     
-    units = ['B/s', 'KB/s', 'MB/s', 'GB/s']
     unit_index = 0
     speed = float(bytes_per_second)
     
-    while speed >= 1024 and unit_index < len(units) - 1:
+    while speed >= 1024 and unit_index < len(_SPEED_UNITS) - 1:
         speed /= 1024
         unit_index += 1
     
     if unit_index == 0:
-        return f"{int(speed)} {units[unit_index]}"
+        return _format_speed(int(speed), 0, 0)
     
-    return f"{speed:.{precision}f} {units[unit_index]}"
+    # round() and the :.{precision}f format agree, so this is the shown value
+    return _format_speed(round(speed, precision), unit_index, precision)
+
+
+@lru_cache(maxsize=4096)
+def _format_speed(speed: float, unit_index: int, precision: int) -> str:
+    if unit_index == 0:
+        return f"{speed} {_SPEED_UNITS[0]}"
+    return f"{speed:.{precision}f} {_SPEED_UNITS[unit_index]}"
 
 
 def format_time(seconds: int) -> str:
@@ -69,6 +91,11 @@ def format_time(seconds: int) -> str:
     Returns:
         Formatted string like "2h 15m" or "45s"
     """
+    return _format_time(seconds)
+
+
+@lru_cache(maxsize=4096)
+def _format_time(seconds: float) -> str:
     if seconds <= 0:
         return "-"
     
@@ -0,0 +1,101 @@
+"""
+Per-URL cache of resolved download metadata (filename and size)
+"""
+import os
+import json
+import time
+import logging
+from collections import OrderedDict
+from PySide6.QtCore import QMutex, QMutexLocker, QStandardPaths
+
+log = logging.getLogger("hdm.metadata")
+
+
+class MetadataCache:
+    """In-memory LRU of metadata results, persisted to a JSON file in AppData"""
+
+    TTL = 86400          # 24 hours for resolved names/sizes
+    FAILED_TTL = 300     # 5 minutes for lookups that fell back to a default name
+    MAX_ENTRIES = 500
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._mutex = QMutex()
+        # Disk writes happen outside _mutex; each carries the version it
+        # snapshotted so a slow older write can't replace a newer file
+        self._save_mutex = QMutex()
+        self._version = 0
+        self._saved_version = 0
+
+        try:
+            config_dir = os.path.join(
+                QStandardPaths.writableLocation(QStandardPaths.AppDataLocation),
+                "HyperDownloadManager"
+            )
+            os.makedirs(config_dir, exist_ok=True)
+            self._cache_file = os.path.join(config_dir, "metadata_cache.json")
+        except OSError:
+            self._cache_file = None
+
+        self._load()
+
+    def _is_fresh(self, entry, now):
+        ttl = self.FAILED_TTL if entry.get('failed') else self.TTL
+        return now - entry.get('ts', 0) < ttl
+
+    def _load(self):
+        """Load unexpired entries from disk"""
+        if not self._cache_file or not os.path.exists(self._cache_file):
+            return
+        try:
+            with open(self._cache_file, 'r') as f:
+                data = json.load(f)
+            now = time.time()
+            for url, entry in data.items():
+                if self._is_fresh(entry, now):
+                    self._entries[url] = entry
+        except (OSError, ValueError, AttributeError) as e:
+            log.warning("Metadata cache load error: %s", e)
+
+    def _save(self, version, data):
+        """Write a serialised snapshot via a temp file, so a crash can't truncate the cache"""
+        if not self._cache_file:
+            return
+        with QMutexLocker(self._save_mutex):
+            if version <= self._saved_version:
+                return
+            tmp_file = self._cache_file + ".tmp"
+            try:
+                with open(tmp_file, 'w') as f:
+                    f.write(data)
+                os.replace(tmp_file, self._cache_file)
+                self._saved_version = version
+            except OSError as e:
+                log.debug("Metadata cache save failed: %s", e)
+
+    def get(self, url):
+        """Return (name, size) for url, or None if missing or expired"""
+        with QMutexLocker(self._mutex):
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            if not self._is_fresh(entry, time.time()):
+                del self._entries[url]
+                return None
+            self._entries.move_to_end(url)
+            return entry['name'], entry['size']
+
+    def set(self, url, name, size, failed=False):
+        """Remember a result; failed lookups expire after FAILED_TTL"""
+        with QMutexLocker(self._mutex):
+            self._entries[url] = {'name': name, 'size': size, 'ts': time.time(), 'failed': failed}
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.MAX_ENTRIES:
+                self._entries.popitem(last=False)
+            self._version += 1
+            version = self._version
+            data = json.dumps(self._entries)
+        self._save(version, data)
+
+
+metadata_cache = MetadataCache()